@@ -0,0 +1,257 @@
+"""
+Differential benchmark of the iterative SLL (proj01) against the recursive
+SLL (proj02) in each of its execution modes.
+
+Every operation runs on a freshly built list for each size and value
+distribution, and reports operations per second, peak memory allocated
+while it ran (tracemalloc, measured in a separate run so it doesn't skew
+the timing) and any error it raised. When an operation first fails, the
+smallest failing size is bisected between the last passing and the
+failing size and recorded under "failure_thresholds". Output is JSON so
+runs can be compared over time.
+
+    python benchmark_lists.py --sizes 100 1000 100000 --output bench.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import proj01
+import proj02
+
+OPERATIONS = ("push", "search", "count", "remove", "remove_all", "reverse", "to_string")
+DISTRIBUTIONS = ("unique", "few", "random")
+
+
+def make_values(distribution: str, size: int, seed: int) -> List[int]:
+    """
+    Generates the values a list is filled with
+    :param distribution: "unique" (0..size-1), "few" (ten distinct values)
+    or "random" (uniform over 0..size-1)
+    :param size: number of values
+    :param seed: seed for the "random" distribution
+    :return: list of values
+    """
+    if distribution == "unique":
+        return list(range(size))
+    if distribution == "few":
+        return [i % 10 for i in range(size)]
+    if distribution == "random":
+        rng = random.Random(seed)
+        return [rng.randrange(size) for _ in range(size)]
+    raise ValueError("unknown distribution " + distribution)
+
+
+def make_queries(values: List[int], queries: int, seed: int) -> List[int]:
+    """
+    Picks the values searched for, counted and removed: half taken from the
+    list and half absent from it
+    :param values: values in the list
+    :param queries: number of queries
+    :param seed: seed for the choice
+    :return: list of query values
+    """
+    rng = random.Random(seed)
+    present = [rng.choice(values) for _ in range(queries - queries // 2)] if values else []
+    absent = [-1 - i for i in range(queries // 2)]
+    return present + absent
+
+
+def implementations() -> Dict[str, Dict[str, Callable]]:
+    """
+    Adapts each list to a common set of operations
+    :return: dict of implementation name to {"new": ..., operation: ...}
+    """
+    impls = {
+        "proj01": {
+            "new": proj01.SinglyLinkedList,
+            "push": lambda data, value: data.push(value),
+            "search": lambda data, value: data.search(value),
+            "count": lambda data, value: data.count(value),
+            "remove": lambda data, value: data.remove(value),
+            "remove_all": lambda data, value: data.remove_all(value),
+            "reverse": lambda data: proj01.reverse(data),
+            "to_string": lambda data: data.to_string(),
+        },
+    }
+    for mode in proj02.RecursiveSinglyLinkedList.MODES:
+        impls["proj02-" + mode] = {
+            "new": lambda mode=mode: proj02.RecursiveSinglyLinkedList(mode),
+            "push": lambda data, value: data.push(value),
+            "search": lambda data, value: data.search(value),
+            # uncached, so repeated query values are traversed like proj01's
+            "count": lambda data, value: data._count(value),
+            "remove": lambda data, value: data.remove(value),
+            "remove_all": lambda data, value: data.remove_all(value),
+            "reverse": lambda data: proj02.reverse(data, data.head),
+            "to_string": lambda data: data.to_string(data.head),
+        }
+    return impls
+
+
+def run_operation(impl: Dict[str, Callable], operation: str, values: List[int],
+                  queries: List[int], trace: bool = False) -> Tuple[int, float, Optional[int]]:
+    """
+    Builds a list from values and runs one operation on it. Building is not
+    part of the measurement except for "push", which is the building
+    :param impl: adapter from implementations()
+    :param operation: name of the operation
+    :param values: values to fill the list with
+    :param queries: values passed to search/count/remove/remove_all
+    :param trace: if True, run tracemalloc around the operation only
+    :return: number of operations performed, the seconds they took and,
+    when tracing, the peak bytes allocated while they ran
+    """
+    data = impl["new"]()
+    run = impl[operation]
+    if operation != "push":
+        push = impl["push"]
+        for value in values:
+            push(data, value)
+
+    if trace:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        if operation == "push":
+            for value in values:
+                run(data, value)
+            ops = len(values)
+        elif operation in ("reverse", "to_string"):
+            run(data)
+            ops = 1
+        else:
+            for value in queries:
+                run(data, value)
+            ops = len(queries)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace else None
+    finally:
+        if trace:
+            tracemalloc.stop()
+    return ops, seconds, peak
+
+
+def measure(impl: Dict[str, Callable], operation: str, values: List[int],
+            queries: List[int]) -> Dict[str, object]:
+    """
+    Times an operation, then reruns it under tracemalloc for its peak memory
+    :param impl: adapter from implementations()
+    :param operation: name of the operation
+    :param values: values to fill the list with
+    :param queries: values passed to search/count/remove/remove_all
+    :return: dict with ops_per_sec, seconds, peak_bytes and error
+    """
+    result = {"ops_per_sec": None, "seconds": None, "peak_bytes": None, "error": None}
+    try:
+        ops, seconds, _ = run_operation(impl, operation, values, queries)
+        result["seconds"] = seconds
+        result["ops_per_sec"] = ops / seconds if seconds > 0 else None
+        result["peak_bytes"] = run_operation(impl, operation, values, queries, trace=True)[2]
+    except (RecursionError, MemoryError) as error:
+        result["error"] = type(error).__name__
+    return result
+
+
+def find_threshold(impl: Dict[str, Callable], operation: str, distribution: str,
+                   passing: int, failing: int, queries: int, seed: int) -> int:
+    """
+    Bisects for the smallest list size at which an operation fails
+    :param impl: adapter from implementations()
+    :param operation: name of the operation
+    :param distribution: value distribution
+    :param passing: a size known to pass
+    :param failing: a size known to fail
+    :param queries: values looked up / removed per query operation
+    :param seed: seed for value generation
+    :return: smallest failing size
+    """
+    while failing - passing > 1:
+        size = (passing + failing) // 2
+        values = make_values(distribution, size, seed)
+        try:
+            run_operation(impl, operation, values, make_queries(values, queries, seed))
+            passing = size
+        except (RecursionError, MemoryError):
+            failing = size
+    return failing
+
+
+def run(sizes: List[int], distributions: List[str], operations: List[str],
+        queries: int = 20, seed: int = 331) -> Dict[str, object]:
+    """
+    Runs the whole benchmark
+    :param sizes: list sizes to benchmark
+    :param distributions: value distributions to benchmark
+    :param operations: operations to benchmark
+    :param queries: values looked up / removed per query operation
+    :param seed: seed for value generation
+    :return: JSON-serialisable report
+    """
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "recursion_limit": sys.getrecursionlimit(),
+        },
+        "parameters": {"sizes": sizes, "distributions": distributions,
+                       "operations": operations, "queries": queries, "seed": seed},
+        "results": [],
+        "failure_thresholds": {},
+    }
+    impls = implementations()
+    for distribution in distributions:
+        last_passing = {}
+        for size in sorted(sizes):
+            values = make_values(distribution, size, seed)
+            query_values = make_queries(values, queries, seed)
+            for name, impl in impls.items():
+                for operation in operations:
+                    row = {"implementation": name, "operation": operation,
+                           "distribution": distribution, "size": size}
+                    row.update(measure(impl, operation, values, query_values))
+                    report["results"].append(row)
+                    thresholds = report["failure_thresholds"].setdefault(name, {})
+                    key = operation + "/" + distribution
+                    if row["error"] is None:
+                        last_passing[name, operation] = size
+                    elif key not in thresholds:
+                        thresholds[key] = find_threshold(impl, operation, distribution,
+                                                         last_passing.get((name, operation), 0),
+                                                         size, queries, seed)
+    return report
+
+
+def main(argv: List[str] = None) -> None:
+    """
+    Command line entry point
+    :param argv: arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=331)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.distributions, args.operations, args.queries, args.seed)
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as out:
+            json.dump(report, out, indent=2)
+
+
+if __name__ == "__main__":
+    main()
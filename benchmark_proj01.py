@@ -0,0 +1,170 @@
+"""
+Benchmarks for the SLLs in proj01: the value index, the unrolled layout,
+in-place reverse and pickling. Each benchmark returns its rows so they can
+be compared or saved; running the module prints them.
+
+    python benchmark_proj01.py
+"""
+
+import pickle
+import time
+import tracemalloc
+from typing import Dict, Iterable, List
+
+import proj01
+
+
+def benchmark_index(sizes: Iterable[int] = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7),
+                    queries: int = 10) -> List[Dict[str, float]]:
+    """
+    Times search, count, remove and remove_all on plain and indexed SLLs.
+    Each list holds `size` values drawn from size // 10 distinct keys. The
+    queried keys occur once each, in the last `queries` positions, so every
+    scan for them walks the whole list (worst case for a scan)
+    :param sizes: list sizes to benchmark
+    :param queries: number of values looked up / removed per operation
+    :return: one dict per (size, mode) with the seconds spent on each operation
+    """
+    results = []
+    for size in sizes:
+        distinct = max(size // 10, queries)
+        # the other keys fill the front; every key then appears once at the back
+        front = max(distinct - queries, 1)
+        values = [i % front for i in range(size - distinct)] + list(range(distinct))
+        targets = [distinct - 1 - i for i in range(queries)]
+        for indexed in (False, True):
+            row = {"size": size, "indexed": indexed}
+
+            start = time.perf_counter()
+            data = proj01.SinglyLinkedList(indexed=indexed)
+            for value in values:
+                data.push(value)
+            row["build"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for value in targets:
+                data.search(value)
+            row["search"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for value in targets:
+                data.count(value)
+            row["count"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for value in targets:
+                data.remove(value)
+            row["remove"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for value in targets:
+                data.remove_all(value)
+            row["remove_all"] = time.perf_counter() - start
+
+            results.append(row)
+    return results
+
+
+def benchmark_unrolled(sizes: Iterable[int] = (10 ** 4, 10 ** 5, 10 ** 6),
+                       capacity: int = 64) -> List[Dict[str, float]]:
+    """
+    Compares SinglyLinkedList with UnrolledSinglyLinkedList on peak memory
+    (tracemalloc) while building, and on the time of a full count() scan
+    :param sizes: list sizes to benchmark
+    :param capacity: block capacity of the unrolled list
+    :return: one dict per (size, layout) with bytes and seconds
+    """
+    results = []
+    for size in sizes:
+        for layout in ("plain", "unrolled"):
+            row = {"size": size, "layout": layout}
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            if layout == "plain":
+                data = proj01.SinglyLinkedList()
+            else:
+                data = proj01.UnrolledSinglyLinkedList(capacity)
+            for i in range(size):
+                data.push(i)
+            row["build"] = time.perf_counter() - start
+            row["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            data.count(-1)
+            row["scan"] = time.perf_counter() - start
+
+            results.append(row)
+    return results
+
+
+def benchmark_reverse(sizes: Iterable[int] = (10 ** 4, 10 ** 5, 10 ** 6)) -> List[Dict[str, float]]:
+    """
+    Compares the in-place reverse with the previous approach of prepending
+    every value into a temporary SLL and pushing them back, on time and on
+    peak memory (tracemalloc) allocated while reversing
+    :param sizes: list sizes to benchmark
+    :return: one dict per (size, method) with seconds and bytes
+    """
+
+    def reverse_by_copy(data: proj01.SinglyLinkedList) -> None:
+        """
+        Reverses the data by rebuilding it, as reverse() used to
+        :param data: an SLL
+        :return: None
+        """
+        temp_SLL = proj01.SinglyLinkedList()
+        current_node = data.head
+        while current_node is not None:
+            temp_SLL.prepend(current_node.val)
+            current_node = current_node.next
+        data._clear()
+        current_node = temp_SLL.head
+        while current_node is not None:
+            data.push(current_node.val)
+            current_node = current_node.next
+
+    results = []
+    for size in sizes:
+        for method, func in (("in_place", proj01.reverse), ("copy", reverse_by_copy)):
+            data = proj01.SinglyLinkedList.from_iterable(range(size))
+            tracemalloc.start()
+            start = time.perf_counter()
+            func(data)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results.append({"size": size, "method": method, "seconds": elapsed, "peak_bytes": peak})
+    return results
+
+
+def benchmark_pickle(size: int = 10 ** 6) -> Dict[str, float]:
+    """
+    Times pickling and unpickling an SLL of `size` ints and reports the
+    pickle size, next to the same numbers for a plain Python list as a floor
+    :param size: number of nodes in the list
+    :return: dict of seconds and bytes
+    """
+    data = proj01.SinglyLinkedList.from_iterable(range(size))
+    plain = list(range(size))
+    results = {"size": size}
+    for name, obj in (("sll", data), ("list", plain)):
+        start = time.perf_counter()
+        blob = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        results[name + "_dump"] = time.perf_counter() - start
+        start = time.perf_counter()
+        pickle.loads(blob)
+        results[name + "_load"] = time.perf_counter() - start
+        results[name + "_bytes"] = len(blob)
+    return results
+
+
+if __name__ == "__main__":
+    for row in benchmark_index(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)):
+        print(row)
+    for row in benchmark_unrolled():
+        print(row)
+    for row in benchmark_reverse():
+        print(row)
+    print(benchmark_pickle())
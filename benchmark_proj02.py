@@ -0,0 +1,95 @@
+"""
+Benchmarks for the recursive SLL in proj02: each operation timed in every
+execution mode, and the per-node cost of native recursion, the trampoline
+and loops. Running the module prints the rows.
+
+    python benchmark_proj02.py
+"""
+
+import time
+from typing import Dict, Iterable, List
+
+import proj02
+
+
+def benchmark_modes(sizes: Iterable[int] = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 6)) -> List[Dict[str, object]]:
+    """
+    Times each operation in every execution mode (recursive, iterative and
+    trampoline). Operations that exceed the recursion limit are reported as
+    "RecursionError"
+    :param sizes: list sizes to benchmark
+    :return: one dict per (size, mode) mapping operation name to seconds
+    """
+    results = []
+    for size in sizes:
+        for mode in proj02.RecursiveSinglyLinkedList.MODES:
+            data = proj02.RecursiveSinglyLinkedList(mode)
+            for i in range(size):
+                data.push(i)
+            missing = -1
+            operations = (
+                ("to_string", lambda: data.to_string(data.head)),
+                ("length", lambda: data.length(data.head)),
+                ("sum_list", lambda: data.sum_list(data.head)),
+                ("search", lambda: data.search(missing)),
+                ("count", lambda: data.count(size - 1)),
+                ("remove", lambda: data.remove(size - 1)),
+                ("remove_all", lambda: data.remove_all(missing)),
+                ("reverse", lambda: proj02.reverse(data, data.head)),
+            )
+            row = {"size": size, "mode": mode}
+            for name, operation in operations:
+                start = time.perf_counter()
+                try:
+                    operation()
+                    row[name] = time.perf_counter() - start
+                except RecursionError:
+                    row[name] = "RecursionError"
+            results.append(row)
+    return results
+
+
+def benchmark_per_node(size: int = 500, repeats: int = 200) -> Dict[str, Dict[str, float]]:
+    """
+    Measures the cost per node, in nanoseconds, of each recursive helper
+    when run as native recursion, through the trampoline and as a loop.
+    `size` must stay under the recursion limit for the recursive numbers
+    :param size: number of nodes in the list
+    :param repeats: times each operation is run
+    :return: dict mapping operation name to {mode: ns per node}
+    """
+    lists = {}
+    for mode in proj02.RecursiveSinglyLinkedList.MODES:
+        lists[mode] = proj02.RecursiveSinglyLinkedList(mode)
+        for i in range(size):
+            lists[mode].push(i)
+
+    results = {}
+    for name in ("to_string", "length", "sum_list", "search", "count", "reverse"):
+        results[name] = {}
+        for mode, data in lists.items():
+            if name == "search":
+                operation = lambda: data.search(-1)
+            elif name == "count":
+                operation = lambda: data._count(0)
+            elif name == "reverse":
+                operation = lambda: proj02.reverse(data, data.head)
+            elif name == "to_string":
+                operation = lambda: data.to_string(data.head)
+            else:
+                # the uncached helpers, so repeats measure the traversal
+                method = getattr(data, "_" + name)
+                operation = lambda: method(data.head)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                operation()
+            elapsed = time.perf_counter() - start
+            results[name][mode] = elapsed / (repeats * size) * 1e9
+    return results
+
+
+if __name__ == "__main__":
+    for row in benchmark_modes():
+        print(row)
+    for name, costs in benchmark_per_node().items():
+        print(name, costs)
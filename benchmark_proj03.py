@@ -0,0 +1,198 @@
+"""
+Benchmarks for the DLL in proj03: the value index, bulk construction,
+splice/concat/split_at against node-by-node moves, and the Node free list
+under GC pressure. Running the module prints the rows.
+
+    python benchmark_proj03.py
+"""
+
+import gc
+import time
+from typing import Dict, List
+
+import proj03
+
+
+def benchmark_index(size: int = 10 ** 6, queries: int = 100) -> List[Dict[str, float]]:
+    """
+    Times find, find_all, remove and remove_all on a plain and an indexed DLL.
+    The DLL holds `size` values drawn from size // 10 distinct keys. The
+    queried keys occur once each, in the last `queries` positions, so every
+    scan for them walks the whole DLL (worst case for a scan).
+    :param size: number of Nodes in the DLL
+    :param queries: number of values looked up / removed per operation
+    :return: one dict per mode with the seconds spent on each operation
+    """
+    distinct = max(size // 10, queries)
+    # the other keys fill the front; every key then appears once at the back
+    front = max(distinct - queries, 1)
+    source = [i % front for i in range(size - distinct)] + list(range(distinct))
+    targets = [distinct - 1 - i for i in range(queries)]
+    results = []
+    for indexed in (False, True):
+        row = {"size": size, "indexed": indexed}
+
+        start = time.perf_counter()
+        dll = proj03.DLL(indexed=indexed)
+        dll.list_to_dll(source)
+        row["build"] = time.perf_counter() - start
+
+        for name in ("find", "find_all", "remove", "remove_all"):
+            operation = getattr(dll, name)
+            start = time.perf_counter()
+            for val in targets:
+                operation(val)
+            row[name] = time.perf_counter() - start
+        results.append(row)
+    return results
+
+
+def benchmark_bulk(size: int = 10 ** 6, repeats: int = 3) -> Dict[str, float]:
+    """
+    Compares building a DLL with one push per value and reading it back with
+    list.append against the bulk list_to_dll / dll_to_list paths, and shows
+    what list_to_dll would gain with the cyclic GC paused around it. Each
+    path reports its best time over `repeats` runs; both readers read the
+    same DLL.
+    :param size: number of values
+    :param repeats: runs per path
+    :return: dict of seconds per path
+    """
+    source = list(range(size))
+
+    def push_each() -> proj03.DLL:
+        dll = proj03.DLL()
+        for item in source:
+            dll.push(item)
+        return dll
+
+    def list_to_dll() -> proj03.DLL:
+        dll = proj03.DLL()
+        dll.list_to_dll(source)
+        return dll
+
+    def list_to_dll_gc_paused() -> proj03.DLL:
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return list_to_dll()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def append_each(dll: proj03.DLL) -> List[int]:
+        py_list = []
+        curr = dll.head
+        while curr is not None:
+            py_list.append(curr.value)
+            curr = curr.next
+        return py_list
+
+    results = {"size": size}
+    for name, operation in (("push_each", push_each), ("list_to_dll", list_to_dll),
+                            ("list_to_dll_gc_paused", list_to_dll_gc_paused)):
+        best = None
+        for _ in range(repeats):
+            start = time.perf_counter()
+            dll = operation()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+            del dll
+        results[name] = best
+
+    dll = list_to_dll()
+    for name, operation in (("append_each", append_each), ("dll_to_list", proj03.DLL.dll_to_list)):
+        best = None
+        for _ in range(repeats):
+            start = time.perf_counter()
+            operation(dll)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+    return results
+
+
+def benchmark_splice(size: int = 10 ** 6) -> Dict[str, float]:
+    """
+    Compares merging two DLLs of size // 2 Nodes and cutting the result in half
+    node by node (pop then push) against concat and split_at.
+    :param size: total number of Nodes
+    :return: dict of seconds per operation
+    """
+    half = size // 2
+    results = {"size": size}
+
+    first, second = proj03.DLL(), proj03.DLL()
+    first.list_to_dll(range(half))
+    second.list_to_dll(range(half, size))
+    start = time.perf_counter()
+    while second.head is not None:
+        first.push(second.head.value)
+        second.pop(back=False)
+    results["merge_pop_push"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while first.size > half:
+        second.push(first.tail.value, back=False)
+        first.pop()
+    results["split_pop_push"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    first.concat(second)
+    results["concat"] = time.perf_counter() - start
+
+    middle = first.head
+    for _ in range(half):
+        middle = middle.next
+    start = time.perf_counter()
+    first.split_at(middle)
+    results["split_at"] = time.perf_counter() - start
+    return results
+
+
+def benchmark_free_list(rounds: int = 200, burst: int = 10 ** 4,
+                        free_list: int = 10 ** 4) -> List[Dict[str, float]]:
+    """
+    Runs a queue workload that pushes `burst` values to the back and then pops
+    them all from the front, `rounds` times, with and without a free list.
+    Reports the seconds taken and how many cyclic GC collections ran, counted
+    through gc.callbacks.
+    :param rounds: number of push/pop bursts
+    :param burst: values pushed and popped per burst
+    :param free_list: free list bound for the recycling run
+    :return: one dict per configuration
+    """
+    collections = [0]
+
+    def count_collections(phase: str, info: Dict[str, int]) -> None:
+        if phase == "start":
+            collections[0] += 1
+
+    results = []
+    for limit in (0, free_list):
+        dll = proj03.DLL(free_list=limit)
+        gc.collect()
+        collections[0] = 0
+        gc.callbacks.append(count_collections)
+        try:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for val in range(burst):
+                    dll.push(val)
+                for _ in range(burst):
+                    dll.pop(back=False)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.callbacks.remove(count_collections)
+        results.append({"free_list": limit, "operations": 2 * rounds * burst,
+                        "seconds": elapsed, "gc_collections": collections[0]})
+    return results
+
+
+if __name__ == "__main__":
+    for row in benchmark_index():
+        print(row)
+    print(benchmark_bulk())
+    print(benchmark_splice())
+    for row in benchmark_free_list():
+        print(row)
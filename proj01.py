@@ -1,4 +1,7 @@
-from typing import TypeVar  # For use in type hinting
+import threading
+from itertools import islice
+from collections import deque
+from typing import TypeVar, List, Dict, Iterable, Iterator, TextIO, Callable, Optional  # For use in type hinting
 
 # Type Declarations
 T = TypeVar('T')  # generic type
@@ -48,21 +51,55 @@ class SLLNode:
         # return self.val == other.val if other is not None else False
 
 
+class SLLBlock:
+    """
+    Node of an unrolled SLL, holding up to `capacity` values in a Python list
+    """
+
+    __slots__ = ['vals', 'next']
+
+    def __init__(self, vals: List[T] = None, next: Node = None) -> None:
+        """
+        Initialize an SLL block
+        :param vals: values held by the block, in list order
+        :param next: reference to the next block in the SLL
+        :return: None
+        """
+        self.vals = [] if vals is None else vals
+        self.next = next
+
+    def __repr__(self) -> str:
+        """
+        Overloads `repr()` method for use in debugging
+        return: string
+        """
+        return '(Block: ' + str(self.vals) + ' )'
+
+
 class SinglyLinkedList:
     """
     Implementation of an SLL
     """
 
-    __slots__ = ['head', 'tail']
+    __slots__ = ['head', 'tail', '_size', '_int_total', '_untracked', '_index', '_prev']
 
-    def __init__(self) -> None:
+    def __init__(self, indexed: bool = False) -> None:
         """
         Initializes an SLL
+        :param indexed: if True, keep a value index so search, count, remove and
+        remove_all don't scan the list. Values must then be hashable
         :return: None
-        DO NOT MODIFY THIS FUNCTION
         """
         self.head = None
         self.tail = None
+        # running aggregates so length() and sum_list() don't walk the list
+        self._size = 0
+        self._int_total = 0   # sum of every int value in the list
+        self._untracked = 0   # number of values that are not ints
+        # value -> deque of nodes holding it (in list order), and
+        # id(node) -> predecessor node. Both are None when not indexed
+        self._index = {} if indexed else None
+        self._prev = {} if indexed else None
 
     def __repr__(self) -> str:
         """
@@ -82,6 +119,156 @@ class SinglyLinkedList:
         return comp(self.head, other.head)
 
     # ============ Modify below ============ #
+    def __iter__(self) -> Iterator[T]:
+        """
+        Yields the values of the SLL from head to tail
+        :return: generator over the values in the list
+        """
+        current_node = self.head
+        while current_node is not None:
+            yield current_node.val
+            current_node = current_node.next
+
+    def __len__(self) -> int:
+        """
+        Overloads `len()` with the maintained node count
+        :return: number of nodes in list
+        """
+        return self._size
+
+    def view(self, start: int = 0, stop: Optional[int] = None) -> 'SLLView':
+        """
+        Returns a lazy view of the values at positions [start, stop) that
+        walks the list when iterated instead of copying it
+        :param start: position of the first value in the view
+        :param stop: position one past the last value, or None for the end
+        :return: SLLView over the range
+        """
+        return SLLView(self, start, stop)
+
+    def __getstate__(self) -> Dict[str, object]:
+        """
+        Pickles the SLL as a flat list of values instead of a chain of nodes,
+        which would recurse once per node
+        :return: state dict with the values and whether the list is indexed
+        """
+        return {'values': list(self), 'indexed': self._index is not None}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """
+        Rebuilds an unpickled SLL from its values in one linking pass
+        :param state: dict produced by __getstate__
+        :return: None
+        """
+        self.__init__(indexed=state['indexed'])
+        self.extend(state['values'])
+
+    def _track(self, value: T) -> None:
+        """
+        Adds a value entering the list to the running aggregates
+        :param value: value that was linked into the list
+        :return: None
+        """
+        self._size += 1
+        if type(value) == int:
+            self._int_total += value
+        else:
+            self._untracked += 1
+
+    def _untrack(self, value: T) -> None:
+        """
+        Removes a value leaving the list from the running aggregates
+        :param value: value that was unlinked from the list
+        :return: None
+        """
+        self._size -= 1
+        if type(value) == int:
+            self._int_total -= value
+        else:
+            self._untracked -= 1
+
+    def _clear(self) -> None:
+        """
+        Empties the SLL and resets the running aggregates
+        :return: None
+        """
+        self.head = None
+        self.tail = None
+        self._size = 0
+        self._int_total = 0
+        self._untracked = 0
+        if self._index is not None:
+            self._index = {}
+            self._prev = {}
+
+    def _index_add(self, node: Node, front: bool = False) -> None:
+        """
+        Records a node in the value index. Must be called before the node is
+        linked in so an unhashable value leaves the list untouched
+        :param node: node about to be linked at the back (or front) of the list
+        :param front: True if the node is about to become the new head
+        :return: None
+        """
+        nodes = self._index.get(node.val)
+        if nodes is None:
+            nodes = self._index[node.val] = deque()
+        if front:
+            nodes.appendleft(node)
+            self._prev[id(node)] = None
+            if self.head is not None:
+                self._prev[id(self.head)] = node
+        else:
+            nodes.append(node)
+            self._prev[id(node)] = self.tail
+
+    def _unlink(self, prev_node: Node, node: Node) -> None:
+        """
+        Unlinks node from the SLL, keeping head, tail, the running aggregates
+        and the value index up to date
+        :param prev_node: node before `node`, or None if `node` is the head
+        :param node: node to unlink
+        :return: None
+        """
+        if prev_node is None:
+            self.head = node.next
+        else:
+            prev_node.next = node.next
+        if node is self.tail:
+            self.tail = prev_node
+        self._untrack(node.val)
+
+        if self._index is not None:
+            nodes = self._index[node.val]
+            # removals almost always take the first occurrence
+            if nodes[0] is node:
+                nodes.popleft()
+            else:
+                nodes.remove(node)
+            if len(nodes) == 0:
+                del self._index[node.val]
+            del self._prev[id(node)]
+            if node.next is not None:
+                self._prev[id(node.next)] = prev_node
+
+    def _reindex(self) -> None:
+        """
+        Rebuilds the value index from the current node order, for operations
+        that move many nodes at once
+        :return: None
+        """
+        self._index = {}
+        self._prev = {}
+        prev_node = None
+        current_node = self.head
+        while current_node is not None:
+            nodes = self._index.get(current_node.val)
+            if nodes is None:
+                nodes = self._index[current_node.val] = deque()
+            nodes.append(current_node)
+            self._prev[id(current_node)] = prev_node
+            prev_node = current_node
+            current_node = current_node.next
+
     def push(self, value: T) -> None:
         """
         Pushes an SLLNode to the end of the list
@@ -90,12 +277,15 @@ class SinglyLinkedList:
         """
 
         node = SLLNode(value)
+        if self._index is not None:
+            self._index_add(node)
         if self.head == None:
             self.head = node
             self.tail = node
         else:
             self.tail.next = node
             self.tail = node
+        self._track(value)
 
 # WRITE YOUR CODE HERE
     def to_string(self) -> str:
@@ -104,16 +294,38 @@ class SinglyLinkedList:
         :return: string representation of the linked list
         """
 
-        SLL_str = ""
         if self.head == None:
             return "None"
-        else:
-            current_node = self.head
-            while current_node.next != None:
-                SLL_str += current_node.val + " --> "
-                current_node = current_node.next
-            SLL_str += current_node.val
-        return SLL_str
+        # join once instead of growing a string per node
+        return " --> ".join(map(str, self))
+
+    def write_to(self, fileobj: TextIO, chunk_size: int = 1024) -> None:
+        """
+        Writes the same text as to_string() to a file-like object, joining and
+        writing at most `chunk_size` nodes at a time so the whole string is
+        never built in memory
+        :param fileobj: object with a `write(str)` method
+        :param chunk_size: number of nodes rendered per write
+        :return: None
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if self.head == None:
+            fileobj.write("None")
+            return
+
+        parts = []
+        separator = ""   # nothing goes in front of the first chunk
+        current_node = self.head
+        while current_node != None:
+            parts.append(str(current_node.val))
+            if len(parts) == chunk_size:
+                fileobj.write(separator + " --> ".join(parts))
+                parts = []
+                separator = " --> "
+            current_node = current_node.next
+        if parts:
+            fileobj.write(separator + " --> ".join(parts))
 
 # WRITE YOUR CODE HERE
 
@@ -122,16 +334,7 @@ class SinglyLinkedList:
         Determines number of nodes in the list
         :return: number of nodes in list
         """
-
-        SLL_len = 0
-        if self.head == None:
-            return 0
-        else:
-            current_node = self.head
-            while current_node != None:
-                SLL_len += 1
-                current_node = current_node.next
-        return SLL_len
+        return self._size
 
 # WRITE YOUR CODE HERE
 
@@ -143,6 +346,9 @@ class SinglyLinkedList:
 
         if self.head == None:
             return None
+        # every value is an int, so the running total is the answer
+        if self._untracked == 0:
+            return self._int_total
         else:
             current_node = self.head
             # check type of nodes
@@ -163,32 +369,23 @@ class SinglyLinkedList:
         :param value: value to remove
         :return: True if a node was removed, False otherwise
         """
-        if self.head == None:
-            return False
-        else:
-            current_node = self.head
-            while current_node != None:
-                # check if current node is at the end of SLL
-                if current_node.next == None:
-                    if current_node.val == value:
-                        self.head = None
-                        self.tail = None
-                        return True
-                    else:
-                        return False
-                # check next node
-                if current_node.next.val == value:
-                    if current_node.next.next == None:
-                        self.tail = current_node
-                    current_node.next = current_node.next.next
-                    return True
-                # check if current node is at the front of SLL
-                if current_node.val == value:
-                    self.head = self.head.next
-                current_node = current_node.next
+        if self._index is not None:
+            nodes = self._index.get(value)
+            if nodes is None:
+                return False
+            self._unlink(self._prev[id(nodes[0])], nodes[0])
+            return True
 
-        return False
+        prev_node = None
+        current_node = self.head
+        while current_node != None:
+            if current_node.val == value:
+                self._unlink(prev_node, current_node)
+                return True
+            prev_node = current_node
+            current_node = current_node.next
 
+        return False
 
 # WRITE YOUR CODE HERE
 
@@ -199,36 +396,81 @@ class SinglyLinkedList:
         :return: True if a node was removed, False otherwise
         """
 
+        if self._index is not None:
+            nodes = self._index.get(value)
+            if nodes is None:
+                return False
+            # nodes are in list order, so each predecessor is already final
+            for node in list(nodes):
+                self._unlink(self._prev[id(node)], node)
+            return True
+
         nodes_removed = False
-        # SLL is empty
-        if self.head == None:
-            return False
-        else:
-            # Remove nodes w/ val from head
-            while self.head.val == value:
-                self.head = self.head.next
+        prev_node = None
+        current_node = self.head
+        while current_node != None:
+            if current_node.val == value:
+                # unlink current node; prev_node stays where it is
+                self._unlink(prev_node, current_node)
                 nodes_removed = True
-                if self.head == None:
-                    break
-            current_node = self.head
-            # Remove nodes w/ val from middle and tail
-            while current_node != None:
-                if current_node.next != None:
-                    if current_node.next.val == value:
-                        if current_node.next.next == None:
-                            self.tail = current_node
-                        current_node.next = current_node.next.next
-                        nodes_removed = True
-                else:
-                    break
-                current_node = current_node.next
-        # SLL is empty
-        if self.head == None:
-            self.tail = None
-        if nodes_removed != False:
-            return True
-        else:
-            return False
+            else:
+                prev_node = current_node
+            current_node = current_node.next
+
+        return nodes_removed
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        """
+        Removes every node whose value satisfies `predicate` in one traversal
+        :param predicate: function called on each value; True means remove
+        :return: number of nodes removed
+        """
+        removed = 0
+        prev_node = None
+        current_node = self.head
+        while current_node is not None:
+            next_node = current_node.next
+            if predicate(current_node.val):
+                self._unlink(prev_node, current_node)
+                removed += 1
+            else:
+                prev_node = current_node
+            current_node = next_node
+        return removed
+
+    def remove_many(self, values: Iterable[T]) -> int:
+        """
+        Removes every node whose value is in `values` in one traversal, so
+        purging k values costs O(n) rather than O(n * k)
+        :param values: values to remove; must be hashable, though the list
+        itself may hold unhashable values
+        :return: number of nodes removed
+        """
+        targets = set(values)
+        if self._index is not None:
+            removed = 0
+            for value in targets:
+                nodes = self._index.get(value)
+                if nodes is None:
+                    continue
+                removed += len(nodes)
+                for node in list(nodes):
+                    self._unlink(self._prev[id(node)], node)
+            return removed
+
+        def matches(value: T) -> bool:
+            """
+            Tests a list value against the targets; values the set can't
+            hash are compared one by one instead
+            :param value: value held by a node
+            :return: True if the node should be removed
+            """
+            try:
+                return value in targets
+            except TypeError:
+                return any(value == target for target in targets)
+
+        return self.remove_if(matches)
 
     # WRITE YOUR CODE HERE
 
@@ -238,6 +480,8 @@ class SinglyLinkedList:
         :param value: value to search for
         :return: `True` if found, else `False`
         """
+        if self._index is not None:
+            return value in self._index
 
         current_node = self.head
         while current_node != None:
@@ -255,6 +499,10 @@ class SinglyLinkedList:
         :param value: value to count
         :return: number of times the value occurred
         """
+        if self._index is not None:
+            nodes = self._index.get(value)
+            return 0 if nodes is None else len(nodes)
+
         count = 0
         current_node = self.head
         while current_node != None:
@@ -273,12 +521,573 @@ class SinglyLinkedList:
         :return: None
         """
         new_node = SLLNode(value)
+        if self._index is not None:
+            self._index_add(new_node, front=True)
         if self.head == None:
             self.head = new_node
             self.tail = new_node
         else:
             new_node.next = self.head
             self.head = new_node
+        self._track(value)
+
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Pushes every value in `values` to the end of the list. The new nodes
+        are linked into a detached chain in one loop and attached at the end,
+        so the list is left untouched if iterating `values` raises. On an
+        indexed list each value is hashed as its node is built, so an
+        unhashable value leaves the list untouched too
+        :param values: iterable of values to push to the list
+        :return: None
+        """
+        index = self._index
+        first = last = None
+        size = 0
+        int_total = 0
+        untracked = 0
+        for value in values:
+            if index is not None:
+                hash(value)
+            node = SLLNode(value)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            size += 1
+            if type(value) == int:
+                int_total += value
+            else:
+                untracked += 1
+
+        if first is None:
+            return
+        if index is not None:
+            # _index_add records self.tail as each node's predecessor
+            node = first
+            while node is not None:
+                self._index_add(node)
+                if self.head is None:
+                    self.head = node
+                else:
+                    self.tail.next = node
+                self.tail = node
+                node = node.next
+        else:
+            if self.head is None:
+                self.head = first
+            else:
+                self.tail.next = first
+            self.tail = last
+        self._size += size
+        self._int_total += int_total
+        self._untracked += untracked
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T], indexed: bool = False) -> SLL:
+        """
+        Builds a new SLL holding `values` in order
+        :param values: iterable of values to put in the list
+        :param indexed: passed through to the constructor
+        :return: the new SLL
+        """
+        data = cls(indexed=indexed)
+        data.extend(values)
+        return data
+
+    def splice(self, other: SLL) -> None:
+        """
+        Moves every node of `other` onto the end of this list without
+        copying, leaving `other` empty. O(1) unless this list is indexed,
+        in which case each moved node has to be added to the index
+        :param other: SLL whose nodes are appended to this list
+        :return: None
+        """
+        if other is self:
+            raise ValueError("cannot splice a list onto itself")
+        first = other.head
+        if first is None:
+            return
+
+        if self._index is not None:
+            # hash every value before touching either list, so an unhashable
+            # one raises with both lists intact (push indexes before linking
+            # for the same reason)
+            node = first
+            while node is not None:
+                hash(node.val)
+                node = node.next
+            node = first
+            while node is not None:
+                self._index_add(node)
+                if self.head is None:
+                    self.head = node
+                else:
+                    self.tail.next = node
+                self.tail = node
+                node = node.next
+        else:
+            if self.head is None:
+                self.head = first
+            else:
+                self.tail.next = first
+            self.tail = other.tail
+        self._size += other._size
+        self._int_total += other._int_total
+        self._untracked += other._untracked
+        other._clear()
+
+
+    def reverse_range(self, i: int, j: int) -> None:
+        """
+        Reverses the nodes at positions [i, j) in place by relinking them;
+        no nodes are allocated
+        :param i: position of the first node to reverse
+        :param j: position one past the last node to reverse
+        :return: None
+        """
+        if not 0 <= i <= j <= self._size:
+            raise IndexError("reverse range out of bounds")
+        if j - i < 2:
+            return
+
+        before = None
+        first = self.head
+        for _ in range(i):
+            before = first
+            first = first.next
+
+        prev_node = None
+        current_node = first
+        for _ in range(j - i):
+            next_node = current_node.next
+            current_node.next = prev_node
+            prev_node = current_node
+            current_node = next_node
+
+        # prev_node now starts the reversed run and first ends it
+        first.next = current_node
+        if before is None:
+            self.head = prev_node
+        else:
+            before.next = prev_node
+        if current_node is None:
+            self.tail = first
+
+        if self._index is not None:
+            self._reindex()
+
+    def reverse(self) -> None:
+        """
+        Reverses the whole SLL in place
+        :return: None
+        """
+        self.reverse_range(0, self._size)
+
+
+class SLLView:
+    """
+    Read-only window over positions [start, stop) of an SLL, in the manner of
+    itertools.islice. Nothing is copied; each iteration walks the list, so
+    the view reflects mutations made after it was created
+    """
+
+    __slots__ = ['data', 'start', 'stop']
+
+    def __init__(self, data: SinglyLinkedList, start: int = 0, stop: Optional[int] = None) -> None:
+        """
+        Initializes a view
+        :param data: SLL being viewed
+        :param start: position of the first value in the view
+        :param stop: position one past the last value, or None for the end
+        :return: None
+        """
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError("view indices must be non-negative")
+        self.data = data
+        self.start = start
+        self.stop = stop
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Yields the values in the viewed range
+        :return: iterator over the values in the view
+        """
+        return islice(self.data, self.start, self.stop)
+
+    def __len__(self) -> int:
+        """
+        Overloads `len()` with the number of values currently in the range
+        :return: number of values in the view
+        """
+        size = len(self.data)
+        stop = size if self.stop is None else min(self.stop, size)
+        return max(0, stop - self.start)
+
+    def __repr__(self) -> str:
+        """
+        Represents the view as a string
+        """
+        return 'SLLView(' + str(self.start) + ', ' + str(self.stop) + ')'
+
+
+class UnrolledSinglyLinkedList:
+    """
+    SLL that stores up to `capacity` values per node. It has the same
+    interface as SinglyLinkedList but allocates one block per `capacity`
+    values, and scans run over each block's list at C speed
+    """
+
+    __slots__ = ['head', 'tail', 'capacity', '_size']
+
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Initializes an unrolled SLL
+        :param capacity: maximum number of values stored in one block
+        :return: None
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.head = None
+        self.tail = None
+        self.capacity = capacity
+        self._size = 0
+
+    def __repr__(self) -> str:
+        """
+        Represents an unrolled SLL as a string
+        """
+        return self.to_string()
+
+    def __getstate__(self) -> Dict[str, object]:
+        """
+        Pickles the list as its capacity and a flat list of values
+        :return: state dict
+        """
+        values = []
+        block = self.head
+        while block is not None:
+            values.extend(block.vals)
+            block = block.next
+        return {'values': values, 'capacity': self.capacity}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """
+        Rebuilds an unpickled list by cutting the values into full blocks
+        :param state: dict produced by __getstate__
+        :return: None
+        """
+        self.__init__(state['capacity'])
+        values = state['values']
+        for i in range(0, len(values), self.capacity):
+            block = SLLBlock(values[i:i + self.capacity])
+            if self.tail is None:
+                self.head = block
+            else:
+                self.tail.next = block
+            self.tail = block
+        self._size = len(values)
+
+    def _unlink(self, prev_block: SLLBlock, block: SLLBlock) -> None:
+        """
+        Unlinks a block from the list, fixing head and tail
+        :param prev_block: block before `block`, or None if `block` is the head
+        :param block: block to unlink
+        :return: None
+        """
+        if prev_block is None:
+            self.head = block.next
+        else:
+            prev_block.next = block.next
+        if block is self.tail:
+            self.tail = prev_block
+
+    def push(self, value: T) -> None:
+        """
+        Pushes a value to the end of the list, starting a new block when the
+        last one is full
+        :param value: value to push to the list
+        :return: None
+        """
+        if self.tail is None:
+            self.head = self.tail = SLLBlock()
+        elif len(self.tail.vals) >= self.capacity:
+            self.tail.next = SLLBlock()
+            self.tail = self.tail.next
+        self.tail.vals.append(value)
+        self._size += 1
+
+    def prepend(self, value: T) -> None:
+        """
+        Puts a value at the front of the list, starting a new block when the
+        first one is full
+        :param value: value to prepend to the list
+        :return: None
+        """
+        if self.head is None:
+            self.head = self.tail = SLLBlock()
+        elif len(self.head.vals) >= self.capacity:
+            self.head = SLLBlock(next=self.head)
+        self.head.vals.insert(0, value)
+        self._size += 1
+
+    def to_string(self) -> str:
+        """
+        Converts the list to the same string form as SinglyLinkedList
+        :return: string representation of the linked list
+        """
+        if self.head is None:
+            return "None"
+        parts = []
+        block = self.head
+        while block is not None:
+            parts.extend(map(str, block.vals))
+            block = block.next
+        return " --> ".join(parts)
+
+    def length(self) -> int:
+        """
+        Determines number of values in the list
+        :return: number of values in list
+        """
+        return self._size
+
+    def sum_list(self) -> T:
+        """
+        Sums the values in the list
+        :return: sum of values in list
+        """
+        if self.head is None:
+            return None
+        # same rule as SinglyLinkedList: the first value picks int or str
+        list_sum = 0 if type(self.head.vals[0]) == int else ""
+        block = self.head
+        while block is not None:
+            for value in block.vals:
+                list_sum += value
+            block = block.next
+        return list_sum
+
+    def remove(self, value: T) -> bool:
+        """
+        Removes the first occurrence of `value` from the list. A block left
+        small enough to share with its successor is merged into it
+        :param value: value to remove
+        :return: True if a value was removed, False otherwise
+        """
+        prev_block = None
+        block = self.head
+        while block is not None:
+            if value in block.vals:
+                block.vals.remove(value)
+                self._size -= 1
+                next_block = block.next
+                if len(block.vals) == 0:
+                    self._unlink(prev_block, block)
+                elif next_block is not None and \
+                        len(block.vals) + len(next_block.vals) <= self.capacity:
+                    block.vals.extend(next_block.vals)
+                    self._unlink(block, next_block)
+                return True
+            prev_block = block
+            block = block.next
+        return False
+
+    def remove_all(self, value: T) -> bool:
+        """
+        Removes every occurrence of `value` from the list, merging neighbouring
+        blocks that end up fitting in one
+        :param value: value to remove
+        :return: True if a value was removed, False otherwise
+        """
+        removed = False
+        prev_block = None
+        block = self.head
+        while block is not None:
+            next_block = block.next
+            if value in block.vals:
+                kept = [val for val in block.vals if val != value]
+                self._size -= len(block.vals) - len(kept)
+                block.vals = kept
+                removed = True
+                if len(kept) == 0:
+                    self._unlink(prev_block, block)
+                    block = next_block
+                    continue
+                if prev_block is not None and \
+                        len(prev_block.vals) + len(kept) <= self.capacity:
+                    prev_block.vals.extend(kept)
+                    self._unlink(prev_block, block)
+                    block = next_block
+                    continue
+            prev_block = block
+            block = next_block
+        return removed
+
+    def search(self, value: T) -> bool:
+        """
+        Searches the list for `value`
+        :param value: value to search for
+        :return: `True` if found, else `False`
+        """
+        block = self.head
+        while block is not None:
+            if value in block.vals:
+                return True
+            block = block.next
+        return False
+
+    def count(self, value: T) -> int:
+        """
+        Returns the number of occurrences of `value` in this list
+        :param value: value to count
+        :return: number of times the value occurred
+        """
+        count = 0
+        block = self.head
+        while block is not None:
+            count += block.vals.count(value)
+            block = block.next
+        return count
+
+    def reverse(self) -> None:
+        """
+        Reverses the list in place by reversing the block order and the
+        values inside each block
+        :return: None
+        """
+        prev_block = None
+        block = self.head
+        while block is not None:
+            next_block = block.next
+            block.vals.reverse()
+            block.next = prev_block
+            prev_block = block
+            block = next_block
+        self.head, self.tail = self.tail, self.head
+
+
+class ConcurrentSinglyLinkedList(SinglyLinkedList):
+    """
+    SLL that can be shared between threads. Every mutation holds one
+    re-entrant lock, while search, count and iteration take no lock at all:
+    a node is fully built before it is linked in, and an unlinked node keeps
+    its `next`, so a reader racing a push or remove still walks a valid
+    chain. Readers racing a reverse may see a mix of the two orders
+    """
+
+    __slots__ = ['_lock']
+
+    def __init__(self, indexed: bool = False) -> None:
+        """
+        Initializes a concurrent SLL
+        :param indexed: passed through to SinglyLinkedList
+        :return: None
+        """
+        super().__init__(indexed)
+        self._lock = threading.RLock()
+
+    def push(self, value: T) -> None:
+        """
+        Pushes an SLLNode to the end of the list while holding the lock
+        :param value: value to push to the list
+        :return: None
+        """
+        with self._lock:
+            super().push(value)
+
+    def prepend(self, value: T) -> None:
+        """
+        Prepends an SLLNode to the list while holding the lock
+        :param value: value to prepend to the list
+        :return: None
+        """
+        with self._lock:
+            super().prepend(value)
+
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Pushes every value in `values` while holding the lock, so the batch
+        appears contiguously
+        :param values: iterable of values to push to the list
+        :return: None
+        """
+        with self._lock:
+            super().extend(values)
+
+    def splice(self, other: SLL) -> None:
+        """
+        Moves every node of `other` onto this list while holding the lock of
+        both lists. Locks are taken in a fixed order so opposite splices
+        can't deadlock
+        :param other: SLL whose nodes are appended to this list
+        :return: None
+        """
+        other_lock = getattr(other, '_lock', None)
+        if other_lock is None or other is self:
+            with self._lock:
+                super().splice(other)
+            return
+        first, second = (self._lock, other_lock) if id(self) < id(other) else (other_lock, self._lock)
+        with first, second:
+            super().splice(other)
+
+    def remove(self, value: T) -> bool:
+        """
+        Removes the first node containing `value` while holding the lock
+        :param value: value to remove
+        :return: True if a node was removed, False otherwise
+        """
+        with self._lock:
+            return super().remove(value)
+
+    def remove_all(self, value: T) -> bool:
+        """
+        Removes every node containing `value` while holding the lock
+        :param value: value to remove
+        :return: True if a node was removed, False otherwise
+        """
+        with self._lock:
+            return super().remove_all(value)
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        """
+        Removes every node whose value satisfies `predicate` while holding
+        the lock
+        :param predicate: function called on each value; True means remove
+        :return: number of nodes removed
+        """
+        with self._lock:
+            return super().remove_if(predicate)
+
+    def remove_many(self, values: Iterable[T]) -> int:
+        """
+        Removes every node whose value is in `values` while holding the lock
+        :param values: values to remove; must be hashable
+        :return: number of nodes removed
+        """
+        with self._lock:
+            return super().remove_many(values)
+
+    def reverse_range(self, i: int, j: int) -> None:
+        """
+        Reverses the nodes at positions [i, j) while holding the lock
+        :param i: position of the first node to reverse
+        :param j: position one past the last node to reverse
+        :return: None
+        """
+        with self._lock:
+            super().reverse_range(i, j)
+
+    def reverse(self) -> None:
+        """
+        Reverses the whole list while holding the lock, so the length it
+        reverses over can't go stale
+        :return: None
+        """
+        with self._lock:
+            super().reverse()
 
 
 def reverse(data: SLL) -> None:
@@ -287,20 +1096,4 @@ def reverse(data: SLL) -> None:
     :param data: an SLL
     :return: None
     """
-    temp_SLL = SinglyLinkedList()
-    current_node = data.head
-    # prepend each node from data SLL to temp_SLL
-    while current_node != None:
-        temp_SLL.prepend(current_node.val)
-        current_node = current_node.next
-    # clear data SLL
-    data.head = None
-    data.tail = None
-    # push nodes from temp_SLL to data SLL
-    current_node2 = temp_SLL.head
-    while current_node2 != None:
-        data.push(current_node2.val)
-        current_node2 = current_node2.next
-
-
-
+    data.reverse()
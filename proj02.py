@@ -1,4 +1,6 @@
-from typing import TypeVar, Tuple  # For use in type hinting
+import functools
+import time
+from typing import TypeVar, Tuple, List, Dict, Iterable, Iterator, Callable  # For use in type hinting
 
 # Type Declarations
 T = TypeVar('T')  # generic type
@@ -47,20 +49,111 @@ class SLLNode:
         return self is other if other is not None else False
 
 
-class RecursiveSinglyLinkedList:
+class _Probe:
     """
-    Recursive implementation of an SLL
+    Counters a profiled operation updates while it traverses the list
     """
 
-    __slots__ = ['head', 'tail']
+    __slots__ = ['visited', 'depth']
 
     def __init__(self) -> None:
+        """
+        Starts both counters at zero
+        :return: None
+        """
+        self.visited = 0   # nodes looked at
+        self.depth = 0     # frames entered by a recursive helper
+
+
+def _profiled(name: str) -> Callable:
+    """
+    Decorates a list operation so that, while profiling is enabled on the
+    list, each call records its wall time, the nodes it traverses and its
+    maximum recursion depth. The call gets a _Probe in data._probe, which
+    the traversal updates as it goes: one visit per node looked at and, in
+    recursive mode, one depth per frame its helper enters. The helpers
+    recurse once per node and only unwind at the end, so frames entered is
+    the maximum depth reached, including when the stack runs out. Loops and
+    the trampoline don't recurse and record 0. When profiling is disabled
+    the cost is one attribute check per call and one None check per node
+    :param name: key the statistics are recorded under
+    :return: decorator
+    """
+    def decorate(operation: Callable) -> Callable:
+        @functools.wraps(operation)
+        def wrapper(data: SLL, *args, **kwargs):
+            if data._stats is None:
+                return operation(data, *args, **kwargs)
+            stats = data._stats.setdefault(name, {"calls": 0, "errors": 0, "nodes_visited": 0,
+                                                  "max_depth": 0, "seconds": 0.0})
+            probe = _Probe()
+            outer = data._probe
+            data._probe = probe
+            stats["calls"] += 1
+            start = time.perf_counter()
+            try:
+                return operation(data, *args, **kwargs)
+            except RecursionError:
+                stats["errors"] += 1
+                raise
+            finally:
+                stats["seconds"] += time.perf_counter() - start
+                data._probe = outer
+                stats["nodes_visited"] += probe.visited
+                stats["max_depth"] = max(stats["max_depth"], probe.depth)
+        return wrapper
+    return decorate
+
+
+def _in_targets(val: T, targets: set) -> bool:
+    """
+    Tests a node value against the set of values being removed. Values the
+    set can't hash are compared with each target instead, so a list holding
+    unhashable values doesn't raise halfway through a removal
+    :param val: value held by a node
+    :param targets: hashable values being removed
+    :return: True if val is one of targets
+    """
+    try:
+        return val in targets
+    except TypeError:
+        return any(val == target for target in targets)
+
+
+class RecursiveSinglyLinkedList:
+    """
+    Recursive implementation of an SLL.
+    In "iterative" mode every operation runs as a loop instead, keeping the
+    same signatures and results without growing the call stack. In
+    "trampoline" mode the recursive helpers run as tail calls through
+    `trampoline`, so the stack stays flat while the code keeps its
+    recursive shape
+    """
+
+    __slots__ = ['head', 'tail', 'mode', '_version', '_cache', '_cache_version', '_stats', '_probe']
+
+    MODES = ("recursive", "iterative", "trampoline")
+
+    def __init__(self, mode: str = "recursive") -> None:
         """
         Initializes an SLL
+        :param mode: execution mode, one of MODES
         :return: None
         """
+        if mode not in self.MODES:
+            raise ValueError("mode must be one of " + str(self.MODES))
         self.head = None
         self.tail = None
+        self.mode = mode
+        # whole-list aggregates are cached and stamped with the version they
+        # were computed at; every mutation bumps _version
+        self._version = 0
+        self._cache = {}
+        self._cache_version = 0
+        # operation name -> statistics dict while profiling, else None
+        self._stats = None
+        # counters of the profiled operation in progress, else None
+        self._probe = None
 
     def __repr__(self) -> str:
         """
@@ -79,6 +172,92 @@ class RecursiveSinglyLinkedList:
 
     # ============ Modify below ============ #
 
+    def __iter__(self) -> Iterator[T]:
+        """
+        Yields the values from head to tail with a loop, so the stack stays
+        flat however long the list is
+        :return: generator over the values in the list
+        """
+        curr = self.head
+        while curr is not None:
+            yield curr.val
+            curr = curr.next
+
+    def find_iter(self, predicate: Callable[[T], bool]) -> Iterator[T]:
+        """
+        Lazily yields the values that satisfy predicate. Stopping the
+        generator early stops the traversal
+        :param predicate: function called on each value
+        :return: generator over the matching values
+        """
+        curr = self.head
+        while curr is not None:
+            if predicate(curr.val):
+                yield curr.val
+            curr = curr.next
+
+    def map_lazy(self, fn: Callable[[T], T]) -> Iterator[T]:
+        """
+        Lazily yields fn(value) for each value, without building a list
+        :param fn: function applied to each value
+        :return: generator over the mapped values
+        """
+        curr = self.head
+        while curr is not None:
+            yield fn(curr.val)
+            curr = curr.next
+
+    def enable_profiling(self) -> None:
+        """
+        Starts recording statistics for search, count, remove, remove_all
+        and reverse, discarding any recorded before
+        :return: None
+        """
+        self._stats = {}
+
+    def disable_profiling(self) -> None:
+        """
+        Stops recording statistics and discards them
+        :return: None
+        """
+        self._stats = None
+
+    def profile_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Exports the recorded statistics. Each operation maps to its number of
+        calls, calls that hit the recursion limit, total nodes visited,
+        maximum recursion depth and total wall time in seconds
+        :return: dict of operation name to statistics, empty if disabled
+        """
+        if self._stats is None:
+            return {}
+        return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def _invalidate(self) -> None:
+        """
+        Marks every cached aggregate as stale
+        :return: None
+        """
+        self._version += 1
+
+    def _cached(self, key: Tuple, compute: Callable, *args) -> T:
+        """
+        Returns the cached result for key, computing and storing it with
+        compute(*args) if the list changed since it was cached
+        :param key: hashable cache key
+        :param compute: function that produces the result
+        :param args: arguments for compute
+        :return: the (possibly cached) result
+        """
+        if self._cache_version != self._version:
+            self._cache.clear()
+            self._cache_version = self._version
+        if key in self._cache:
+            return self._cache[key]
+        result = compute(*args)
+        self._cache[key] = result
+        return result
+
     def push(self, value: T, back: bool = True) -> None:
         """
         Inserts an SLLNode at the end of the list if back
@@ -103,6 +282,46 @@ class RecursiveSinglyLinkedList:
             else:
                 node.next = self.head
                 self.head = node
+        self._invalidate()
+
+    def push_many(self, values: Iterable[T], back: bool = True) -> None:
+        """
+        Pushes every value in `values`, giving the same list as calling
+        push(value, back) for each one in order (so front pushes end up
+        reversed at the head). The nodes are linked into a chain first and
+        the chain is attached to the list in one step
+        :param values: values to push to the list
+        :param back: bool True/False to insert at front vs. end of list
+        :return: None
+        """
+        first = last = None
+        if back == True:
+            for value in values:
+                node = SLLNode(value)
+                if last is None:
+                    first = node
+                else:
+                    last.next = node
+                last = node
+        else:
+            # each new node goes in front of the chain, as push would do
+            for value in values:
+                first = SLLNode(value, first)
+                if last is None:
+                    last = first
+        if first is None:
+            return
+
+        if self.head is None:
+            self.head = first
+            self.tail = last
+        elif back == True:
+            self.tail.next = first
+            self.tail = last
+        else:
+            last.next = self.head
+            self.head = first
+        self._invalidate()
 
     def to_string(self, curr: Node) -> str:
         """
@@ -110,23 +329,80 @@ class RecursiveSinglyLinkedList:
         :param curr: current node which starts at head of SLL
         :return: string representation of the linked list
         """
+        if self.mode == "iterative":
+            return self._to_string_loop(curr)
+        if self.mode == "trampoline":
+            return trampoline(_to_string_step, curr, [])
 
-        if (curr != None) and (curr.next != None):
-            return str(curr.val) + " --> " + self.to_string(curr.next)
-        elif (curr != None):
-            return str(curr.val)
-        else:
+        if curr is None:
             return "None"
+        parts = []
+
+        def to_string_inner(node: Node) -> None:
+            """
+            Collects the text of each node from node to the end in parts,
+            so the result is joined once instead of copying the suffix at
+            every level
+            :param node: current node
+            :return: None
+            """
+            if node is not None:
+                parts.append(str(node.val))
+                to_string_inner(node.next)
+
+        to_string_inner(curr)
+        return " --> ".join(parts)
+
+    def to_string_chunks(self, curr: Node, chunk_size: int = 1024) -> Iterator[str]:
+        """
+        Yields to_string(curr) in pieces of at most `chunk_size` nodes, for
+        streaming long lists without building the whole string. Runs as a
+        loop in every mode
+        :param curr: current node which starts at head of SLL
+        :param chunk_size: number of nodes rendered per piece
+        :return: generator of strings that concatenate to to_string(curr)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if curr is None:
+            yield "None"
+            return
+        parts = []
+        separator = ""   # nothing goes in front of the first chunk
+        while curr is not None:
+            parts.append(str(curr.val))
+            if len(parts) == chunk_size:
+                yield separator + " --> ".join(parts)
+                parts = []
+                separator = " --> "
+            curr = curr.next
+        if parts:
+            yield separator + " --> ".join(parts)
 
     def length(self, curr: Node) -> int:
         """
-        Determines number of nodes in the list starting at head curr
+        Determines number of nodes in the list starting at head curr.
+        The whole-list length is cached until the next mutation
+        :param curr: current node which starts at head of SLL
+        :return: int number of nodes in list
+        """
+        if curr is not None and curr is self.head:
+            return self._cached(("length",), self._length, curr)
+        return self._length(curr)
+
+    def _length(self, curr: Node) -> int:
+        """
+        Uncached length
         :param curr: current node which starts at head of SLL
         :return: int number of nodes in list
         """
+        if self.mode == "iterative":
+            return self._length_loop(curr)
+        if self.mode == "trampoline":
+            return trampoline(_length_step, curr, 0)
 
         if (curr != None) and (curr.next != None):
-            return (1 + self.length(curr.next))
+            return (1 + self._length(curr.next))
         elif (curr != None):
             return 1
         else:
@@ -134,23 +410,45 @@ class RecursiveSinglyLinkedList:
 
     def sum_list(self, curr: Node) -> T:
         """
-        Sums the values in the list
+        Sums the values in the list.
+        The whole-list sum is cached until the next mutation
+        :param curr: current node which starts at head of SLL
+        :return: sum of values in list
+        """
+        if curr is not None and curr is self.head:
+            return self._cached(("sum_list",), self._sum_list, curr)
+        return self._sum_list(curr)
+
+    def _sum_list(self, curr: Node) -> T:
+        """
+        Uncached sum_list
         :param curr: current node which starts at head of SLL
         :return: sum of values in list
         """
+        if self.mode == "iterative":
+            return self._sum_list_loop(curr)
+        if self.mode == "trampoline":
+            return trampoline(_sum_list_step, curr, [])
+
         if (curr != None) and (curr.next != None):
-            return (curr.val + self.sum_list(curr.next))
+            return (curr.val + self._sum_list(curr.next))
         elif (curr != None):
             return curr.val
         else:
             return None
 
+    @_profiled("search")
     def search(self, value: T) -> bool:
         """
         Searches the SLL for a node containing `value`
         :param value: value to search for
         :return: `True` if found, else `False`
         """
+        if self.mode == "iterative":
+            return self._search_loop(value)
+        if self.mode == "trampoline":
+            return trampoline(_search_step, self.head, value, self._probe)
+        probe = self._probe
 
         def search_inner(curr: Node) -> bool:
             """
@@ -158,6 +456,9 @@ class RecursiveSinglyLinkedList:
             :param curr: current node which starts at head of SLL
             :return: `True` if found, else `False`
             """
+            if probe is not None:
+                probe.visited += curr is not None
+                probe.depth += 1
             if (curr != None) and (curr.next != None):
                 if curr.val == value:
                     return True
@@ -170,12 +471,33 @@ class RecursiveSinglyLinkedList:
 
         return search_inner(self.head)
 
+    @_profiled("count")
     def count(self, value: T) -> int:
         """
-        Returns the number of occurrences of `value` in this list
+        Returns the number of occurrences of `value` in this list.
+        Counts of hashable values are cached until the next mutation; while
+        profiling, a cache hit is recorded as a call that visited no nodes
         :param value: value to count
         :return: number of times the value occurred
         """
+        key = ("count", value)
+        try:
+            hash(key)
+        except TypeError:
+            return self._count(value)
+        return self._cached(key, self._count, value)
+
+    def _count(self, value: T) -> int:
+        """
+        Uncached count
+        :param value: value to count
+        :return: number of times the value occurred
+        """
+        if self.mode == "iterative":
+            return self._count_loop(value)
+        if self.mode == "trampoline":
+            return trampoline(_count_step, self.head, value, 0, self._probe)
+        probe = self._probe
 
         def count_inner(curr: Node) -> int:
             """
@@ -184,6 +506,9 @@ class RecursiveSinglyLinkedList:
             :param curr: current node which starts at head of SLL
             :return: number of times the value occurred
             """
+            if probe is not None:
+                probe.visited += curr is not None
+                probe.depth += 1
             if (curr != None) and (curr.next != None):
                 if curr.val == value:
                     return (1 + count_inner(curr.next))
@@ -196,12 +521,20 @@ class RecursiveSinglyLinkedList:
 
         return count_inner(self.head)
 
+    @_profiled("remove")
     def remove(self, value: T) -> bool:
         """
         Removes the first node containing `value` from the SLL
         :param value: value to remove
         :return: True if a node was removed, False otherwise
         """
+        # remove doesn't recurse in tail position, so trampoline mode loops too
+        if self.mode != "recursive":
+            removed_bool = self._remove_loop(value, 1) == 1
+            if removed_bool:
+                self._invalidate()
+            return removed_bool
+        probe = self._probe
 
         def remove_inner(curr: Node) -> Tuple[Node, bool]:
             """
@@ -211,6 +544,9 @@ class RecursiveSinglyLinkedList:
             :return: tuple with the head of the list and bool indicating
             if anything was successfully deleted
             """
+            if probe is not None:
+                probe.depth += 1
+                probe.visited += curr is self.head and curr is not None
 
             if self.head == None:
                 return (self.head, False)
@@ -225,6 +561,8 @@ class RecursiveSinglyLinkedList:
                         self.tail = None
                     return (self.head, True)
                 elif (curr != None) and (curr.next != None):
+                    if probe is not None:
+                        probe.visited += 1   # curr.next
                     if curr.next.next == None:
                         # check last node in list
                         if curr.next.val == value:
@@ -245,61 +583,328 @@ class RecursiveSinglyLinkedList:
                     return (self.head, False)
 
         head_node, removed_bool = remove_inner(self.head)
+        if removed_bool:
+            self._invalidate()
         return removed_bool
 
-    def remove_all(self, value: T) -> bool:
+    @_profiled("remove_all")
+    def remove_all(self, value: T = None, values: Iterable[T] = None) -> int:
         """
-        Removes all nodes in the list with the given value
+        Removes all nodes in the list with the given value, or with any of
+        `values`, in a single traversal. If the counts of the values are
+        cached the traversal stops after the last match
         :param value: value to remove
-        :return: True if a node was removed, False otherwise
+        :param values: values to remove instead of `value`; must be hashable
+        :return: number of nodes removed
         """
+        targets = None if values is None else set(values)
+        limit = self._known_count(value, targets)
+        if limit == 0:
+            return 0
+        if self.mode != "recursive":
+            removed = self._remove_loop(value, limit, targets)
+        else:
+            probe = self._probe
 
-        def remove_all_inner(curr: Node) -> Tuple[Node, bool]:
-            """
-            Removes all nodes in the list with the given value
-            (from remove_all) starting at head curr
-            :param curr: current node which starts at head of SLL
-            :return: tuple with the head of the list and bool indicating
-            if anything was successfully deleted
-            """
-            if self.head == None:
-                return (self.head, False)
-            elif curr == None:
-                return (self.head, False)
-            else:
-                # check head, remove node if it is value
-                if self.head.val == value:
-                    self.head = self.head.next
-                    # check if the last node was removed. aka list is now empty
-                    if self.head == None:
-                        self.tail = None
-                    remove_all_inner(curr.next)
-                    return (self.head, True)
-                elif (curr != None) and (curr.next != None):
-                    if curr.next.next == None:
-                        # check last node in list
-                        if curr.next.val == value:
-                            curr.next = curr.next.next
-                            self.tail = curr
-                            return (self.head, True)
-                        else:
-                            return (self.head, False)
-                    # check next node
-                    elif curr.next.val == value:
-                        curr.next = curr.next.next
-                        remove_all_inner(curr.next)
-                        return (self.head, True)
-                    # node hasn't been found yet, call func again with next node
+            def remove_all_inner(prev: Node, curr: Node, removed: int) -> int:
+                """
+                Removes the matching nodes from curr to the end, unlinking
+                each from prev and fixing head and tail as it goes
+                :param prev: last kept node before curr, None if curr is head
+                :param curr: current node which starts at head of SLL
+                :param removed: nodes removed so far
+                :return: total number of nodes removed
+                """
+                if curr is None or removed == limit:
+                    return removed
+                if probe is not None:
+                    probe.visited += 1
+                    probe.depth += 1
+                if _in_targets(curr.val, targets) if targets is not None else (curr.val == value):
+                    if prev is None:
+                        self.head = curr.next
                     else:
-                        return remove_all_inner(curr.next)
-                # value not in list
+                        prev.next = curr.next
+                    if curr is self.tail:
+                        self.tail = prev
+                    return remove_all_inner(prev, curr.next, removed + 1)
+                return remove_all_inner(curr, curr.next, removed)
+
+            removed = remove_all_inner(None, self.head, 0)
+        if removed:
+            self._invalidate()
+        return removed
+
+    def _known_count(self, value: T, targets: set = None) -> int:
+        """
+        Looks up how many nodes hold value (or any of targets) from the
+        count cache, without traversing
+        :param value: value being removed
+        :param targets: values being removed instead of value, or None
+        :return: the total count, or -1 if any count isn't cached
+        """
+        if self._cache_version != self._version:
+            return -1
+        total = 0
+        for target in (targets if targets is not None else (value,)):
+            try:
+                cached = self._cache.get(("count", target))
+            except TypeError:
+                return -1
+            if cached is None:
+                return -1
+            total += cached
+        return total
+
+    # ============ Iterative execution ============ #
+
+    def _to_string_loop(self, curr: Node) -> str:
+        """
+        Loop version of to_string
+        :param curr: node to start from
+        :return: string representation of the list starting at curr
+        """
+        if curr is None:
+            return "None"
+        parts = []
+        while curr is not None:
+            parts.append(str(curr.val))
+            curr = curr.next
+        return " --> ".join(parts)
+
+    def _length_loop(self, curr: Node) -> int:
+        """
+        Loop version of length
+        :param curr: node to start from
+        :return: number of nodes from curr to the end
+        """
+        count = 0
+        while curr is not None:
+            count += 1
+            curr = curr.next
+        return count
+
+    def _sum_list_loop(self, curr: Node) -> T:
+        """
+        Loop version of sum_list. The recursion adds from the back
+        (v1 + (v2 + (...))), so the values are folded in the same order to
+        give identical results for non-commutative or float values
+        :param curr: node to start from
+        :return: sum of values from curr to the end, or None if curr is None
+        """
+        if curr is None:
+            return None
+        values = []
+        while curr is not None:
+            values.append(curr.val)
+            curr = curr.next
+        total = values.pop()
+        while values:
+            total = values.pop() + total
+        return total
+
+    def _search_loop(self, value: T) -> bool:
+        """
+        Loop version of search
+        :param value: value to search for
+        :return: `True` if found, else `False`
+        """
+        probe = self._probe
+        curr = self.head
+        while curr is not None:
+            if probe is not None:
+                probe.visited += 1
+            if curr.val == value:
+                return True
+            curr = curr.next
+        return False
+
+    def _count_loop(self, value: T) -> int:
+        """
+        Loop version of count
+        :param value: value to count
+        :return: number of times the value occurred
+        """
+        probe = self._probe
+        count = 0
+        curr = self.head
+        while curr is not None:
+            if probe is not None:
+                probe.visited += 1
+            if curr.val == value:
+                count += 1
+            curr = curr.next
+        return count
+
+    def _remove_loop(self, value: T, limit: int, targets: set = None) -> int:
+        """
+        Loop version of remove and remove_all
+        :param value: value to remove
+        :param limit: stop after this many removals; -1 for no limit
+        :param targets: values to remove instead of `value`, or None
+        :return: number of nodes removed
+        """
+        probe = self._probe
+        removed = 0
+        prev = None
+        curr = self.head
+        while curr is not None and removed != limit:
+            if probe is not None:
+                probe.visited += 1
+            if _in_targets(curr.val, targets) if targets is not None else (curr.val == value):
+                if prev is None:
+                    self.head = curr.next
                 else:
-                    return (self.head, False)
+                    prev.next = curr.next
+                if curr is self.tail:
+                    self.tail = prev
+                removed += 1
+            else:
+                prev = curr
+            curr = curr.next
+        return removed
 
-        head_node, removed_bool = remove_all_inner(self.head)
-        return removed_bool
+
+class PersistentSinglyLinkedList(RecursiveSinglyLinkedList):
+    """
+    Immutable version of RecursiveSinglyLinkedList. push, push_many, remove
+    and remove_all leave this list untouched and return a new version that
+    shares every node it didn't have to change: a front push shares the
+    whole old list, and a removal copies only the nodes before the last one
+    removed. Read operations are inherited unchanged
+    """
+
+    __slots__ = []
+
+    def _new_version(self, head: Node, tail: Node) -> 'PersistentSinglyLinkedList':
+        """
+        Creates a version of this list with the given head and tail
+        :param head: first node of the new version
+        :param tail: last node of the new version
+        :return: the new version
+        """
+        version = type(self)(self.mode)
+        version.head = head
+        version.tail = tail
+        return version
+
+    def _copy_until(self, stop: Node, skip: Callable[[T], bool] = None) -> Tuple[Node, Node]:
+        """
+        Copies the nodes from head up to (not including) stop into a new
+        chain, optionally leaving out nodes whose value satisfies skip
+        :param stop: first node not to copy, or None to copy everything
+        :param skip: predicate on values to leave out, or None to keep all
+        :return: first and last node of the copy, both None if it is empty
+        """
+        first = last = None
+        curr = self.head
+        while curr is not stop:
+            if skip is None or not skip(curr.val):
+                node = SLLNode(curr.val)
+                if last is None:
+                    first = node
+                else:
+                    last.next = node
+                last = node
+            curr = curr.next
+        return first, last
+
+    def _join(self, first: Node, last: Node, rest: Node) -> 'PersistentSinglyLinkedList':
+        """
+        Creates a version made of a freshly copied chain followed by a
+        shared suffix of this list
+        :param first: first node of the copied chain, or None if it is empty
+        :param last: last node of the copied chain, or None if it is empty
+        :param rest: first shared node, or None if nothing is shared
+        :return: the new version
+        """
+        if last is None:
+            return self._new_version(rest, self.tail if rest is not None else None)
+        last.next = rest
+        return self._new_version(first, self.tail if rest is not None else last)
+
+    def push(self, value: T, back: bool = True) -> 'PersistentSinglyLinkedList':
+        """
+        Returns a version with value added at the end (if back) or front.
+        A front push is O(1) and shares the whole list; a back push has to
+        copy every node
+        :param value: value to push to the list
+        :param back: bool True/False to insert at front vs. end of list
+        :return: the new version
+        """
+        if back == True:
+            return self.push_many((value,))
+        node = SLLNode(value, self.head)
+        return self._new_version(node, self.tail if self.head is not None else node)
+
+    def push_many(self, values: Iterable[T], back: bool = True) -> 'PersistentSinglyLinkedList':
+        """
+        Returns a version with every value pushed as by push(value, back) in
+        order. Front pushes share the whole list; back pushes copy it once
+        :param values: values to push to the list
+        :param back: bool True/False to insert at front vs. end of list
+        :return: the new version
+        """
+        if back == True:
+            first, last = self._copy_until(None)
+            for value in values:
+                node = SLLNode(value)
+                if last is None:
+                    first = node
+                else:
+                    last.next = node
+                last = node
+            return self._new_version(first, last)
+
+        head = self.head
+        tail = self.tail
+        for value in values:
+            head = SLLNode(value, head)
+            if tail is None:
+                tail = head
+        return self._new_version(head, tail)
+
+    def remove(self, value: T) -> 'PersistentSinglyLinkedList':
+        """
+        Returns a version without the first node containing `value`. Only
+        the nodes before it are copied
+        :param value: value to remove
+        :return: the new version, or this list if value is absent
+        """
+        target = self.head
+        while target is not None and not target.val == value:
+            target = target.next
+        if target is None:
+            return self
+        first, last = self._copy_until(target)
+        return self._join(first, last, target.next)
+
+    def remove_all(self, value: T = None, values: Iterable[T] = None) -> 'PersistentSinglyLinkedList':
+        """
+        Returns a version without any node containing `value` (or any of
+        `values`). Only the nodes before the last match are copied
+        :param value: value to remove
+        :param values: values to remove instead of `value`; must be hashable
+        :return: the new version, or this list if nothing matches
+        """
+        if values is None:
+            matches = lambda val: val == value
+        else:
+            targets = set(values)
+            matches = lambda val: _in_targets(val, targets)
+        last_match = None
+        curr = self.head
+        while curr is not None:
+            if matches(curr.val):
+                last_match = curr
+            curr = curr.next
+        if last_match is None:
+            return self
+        first, last = self._copy_until(last_match, skip=matches)
+        return self._join(first, last, last_match.next)
 
 
+@_profiled("reverse")
 def reverse(data: SLL, curr: Node) -> None:
     """
     Reverses the data
@@ -307,6 +912,28 @@ def reverse(data: SLL, curr: Node) -> None:
     :param curr: current node which starts at head of SLL
     :return: None
     """
+    if isinstance(data, PersistentSinglyLinkedList):
+        raise TypeError("persistent lists share nodes and can't be reversed in place")
+    # order matters to sum_list on non-numeric values
+    data._invalidate()
+    if data.mode == "iterative":
+        _reverse_loop(data, curr)
+        return None
+    if data.mode == "trampoline":
+        data.tail = data.head
+        trampoline(_reverse_step, data, curr, None, data._probe)
+        return None
+    _reverse_recursive(data, curr, data._probe)
+
+
+def _reverse_recursive(data: SLL, curr: Node, probe: _Probe = None) -> None:
+    """
+    Recursive body of reverse
+    :param data: an SLL
+    :param curr: current node which starts at head of SLL
+    :param probe: counters to update while profiling, else None
+    :return: None
+    """
     # base cases
     # Assign tail to be head
     data.tail = data.head
@@ -314,15 +941,181 @@ def reverse(data: SLL, curr: Node) -> None:
         return None
     else:
         next_node = curr.next
+    if probe is not None:
+        probe.visited += 1
+        probe.depth += 1
     # check for end of list
     if next_node == None:
         # assign last node in list to be head
         data.head = curr
         return None
     # recursive call: go to next node
-    reverse(data, next_node)
+    _reverse_recursive(data, next_node, probe)
     # starting from end of list, essentially change direction of arrows
     # Make the next node after curr point back to curr
     next_node.next = curr
     # remove pointer from curr to next node
     curr.next = None
+
+
+def _reverse_loop(data: SLL, curr: Node) -> None:
+    """
+    Loop version of reverse: relinks every node from curr to the end
+    :param data: an SLL
+    :param curr: current node which starts at head of SLL
+    :return: None
+    """
+    data.tail = data.head
+    if curr is None:
+        return None
+    probe = data._probe
+    prev = None
+    while curr is not None:
+        if probe is not None:
+            probe.visited += 1
+        next_node = curr.next
+        curr.next = prev
+        prev = curr
+        curr = next_node
+    data.head = prev
+
+
+class Bounce:
+    """
+    A pending tail call. A step function returns a Bounce instead of
+    calling itself, and `trampoline` makes the call from its loop
+    """
+
+    __slots__ = ['fn', 'args']
+
+    def __init__(self, fn: Callable, *args) -> None:
+        """
+        Records a tail call
+        :param fn: function to call next
+        :param args: arguments for fn
+        :return: None
+        """
+        self.fn = fn
+        self.args = args
+
+
+def trampoline(fn: Callable, *args) -> T:
+    """
+    Runs fn(*args) and keeps making the calls it bounces to until one
+    returns a plain value, so recursion depth never grows
+    :param fn: step function to start with
+    :param args: arguments for fn
+    :return: the first result that is not a Bounce
+    """
+    result = fn(*args)
+    while type(result) is Bounce:
+        result = result.fn(*result.args)
+    return result
+
+
+def _to_string_step(curr: Node, parts: List[str]) -> object:
+    """
+    to_string as a tail call, collecting each value's text in parts
+    :param curr: current node
+    :param parts: text of the nodes already visited
+    :return: the joined string, or a Bounce to the next node
+    """
+    if curr is None:
+        return " --> ".join(parts) if parts else "None"
+    parts.append(str(curr.val))
+    return Bounce(_to_string_step, curr.next, parts)
+
+
+def _length_step(curr: Node, count: int) -> object:
+    """
+    length as a tail call with the running count as an accumulator
+    :param curr: current node
+    :param count: nodes counted so far
+    :return: the count, or a Bounce to the next node
+    """
+    if curr is None:
+        return count
+    return Bounce(_length_step, curr.next, count + 1)
+
+
+def _sum_list_step(curr: Node, values: List[T]) -> object:
+    """
+    sum_list as a tail call. The recursion adds from the back, so values
+    are stacked on the way down and folded by _sum_fold_step
+    :param curr: current node
+    :param values: values visited so far
+    :return: None for an empty list, or a Bounce
+    """
+    if curr is not None:
+        values.append(curr.val)
+        return Bounce(_sum_list_step, curr.next, values)
+    if len(values) == 0:
+        return None
+    return Bounce(_sum_fold_step, values, values.pop())
+
+
+def _sum_fold_step(values: List[T], total: T) -> object:
+    """
+    Adds the stacked values to the total from the back
+    :param values: values still to add
+    :param total: sum of the values already popped
+    :return: the sum, or a Bounce with the next value added
+    """
+    if len(values) == 0:
+        return total
+    return Bounce(_sum_fold_step, values, values.pop() + total)
+
+
+def _search_step(curr: Node, value: T, probe: _Probe = None) -> object:
+    """
+    search_inner as a tail call
+    :param curr: current node
+    :param value: value to search for
+    :param probe: counters to update while profiling, else None
+    :return: `True` if found, `False` at the end, or a Bounce to the next node
+    """
+    if curr is None:
+        return False
+    if probe is not None:
+        probe.visited += 1
+    if curr.val == value:
+        return True
+    return Bounce(_search_step, curr.next, value, probe)
+
+
+def _count_step(curr: Node, value: T, count: int, probe: _Probe = None) -> object:
+    """
+    count_inner as a tail call with the running count as an accumulator
+    :param curr: current node
+    :param value: value to count
+    :param count: occurrences found so far
+    :param probe: counters to update while profiling, else None
+    :return: the count, or a Bounce to the next node
+    """
+    if curr is None:
+        return count
+    if probe is not None:
+        probe.visited += 1
+    if curr.val == value:
+        count += 1
+    return Bounce(_count_step, curr.next, value, count, probe)
+
+
+def _reverse_step(data: SLL, curr: Node, prev: Node, probe: _Probe = None) -> object:
+    """
+    reverse as a tail call: points curr back at prev and moves on
+    :param data: an SLL
+    :param curr: current node
+    :param prev: node before curr in the original order
+    :param probe: counters to update while profiling, else None
+    :return: None once the end is reached, or a Bounce to the next node
+    """
+    if curr is None:
+        if prev is not None:
+            data.head = prev
+        return None
+    if probe is not None:
+        probe.visited += 1
+    next_node = curr.next
+    curr.next = prev
+    return Bounce(_reverse_step, data, next_node, curr, probe)
@@ -1,5 +1,6 @@
 
-from typing import TypeVar, List
+from collections import deque
+from typing import TypeVar, List, Iterable
 
 # for more information on type hinting, check out https://docs.python.org/3/library/typing.html
 T = TypeVar("T")  # represents generic type
@@ -52,16 +53,27 @@ class DLL:
     Implementation of a doubly linked list without padding nodes.
     Modify only below indicated line.
     """
-    __slots__ = ["head", "tail", "size"]
+    __slots__ = ["head", "tail", "size", "_index", "_free", "_free_limit"]
 
-    def __init__(self) -> None:
+    def __init__(self, indexed: bool = False, free_list: int = 0) -> None:
         """
         Construct an empty doubly linked list.
 
+        :param indexed: if True, keep a value index so find, find_all, remove
+        and remove_all don't scan the list. Values must then be hashable.
+        :param free_list: keep up to this many Nodes removed by pop, remove
+        and remove_all for push to reuse instead of allocating. 0 disables it.
+        A recycled Node is cleared and later reused, so with a free list,
+        Nodes returned by find/find_all must not be used after removal.
         :return: None.
         """
         self.head = self.tail = None
         self.size = 0
+        # value -> deque of the Nodes holding it, in list order; None when not indexed
+        self._index = {} if indexed else None
+        # cleared Nodes waiting to be reused by push; None when disabled
+        self._free = [] if free_list > 0 else None
+        self._free_limit = free_list
 
     def __repr__(self) -> str:
         """
@@ -110,6 +122,61 @@ class DLL:
     # MODIFY BELOW #
     # Refer to the classes provided to understand the problems better#
 
+    def __len__(self) -> int:
+        """
+        Overloads `len()` with the maintained Node count.
+        :return: number of Nodes in the DLL
+        """
+        return self.size
+
+    def _index_add(self, node: Node, back: bool = True) -> None:
+        """
+        Records a Node that is being linked in at the back (or front) of the DLL
+        :param node: Node being added
+        :param back: bool: True if the Node goes at the back, False for the front
+        :return: None
+        """
+        nodes = self._index.get(node.value)
+        if nodes is None:
+            nodes = self._index[node.value] = deque()
+        if back == True:
+            nodes.append(node)
+        else:
+            nodes.appendleft(node)
+
+    def _index_discard(self, node: Node) -> None:
+        """
+        Forgets a Node that is being unlinked from the DLL
+        :param node: Node being removed
+        :return: None
+        """
+        nodes = self._index[node.value]
+        # removals from either end of the list are O(1)
+        if nodes[0] is node:
+            nodes.popleft()
+        elif nodes[-1] is node:
+            nodes.pop()
+        else:
+            # match by identity: Node.__eq__ compares values
+            for i, candidate in enumerate(nodes):
+                if candidate is node:
+                    del nodes[i]
+                    break
+        if len(nodes) == 0:
+            del self._index[node.value]
+
+    def _recycle(self, node: Node) -> None:
+        """
+        Clears a Node that was unlinked from the DLL and keeps it for push,
+        unless the free list is disabled or full
+        :param node: Node that was removed
+        :return: None
+        """
+        free = self._free
+        if free is not None and len(free) < self._free_limit:
+            node.value = node.next = node.prev = None
+            free.append(node)
+
     def empty(self) -> bool:
         """
         Determines if DLL is empty or not.
@@ -128,7 +195,13 @@ class DLL:
         :param back: bool: If True, add val to the back of the DLL. If False, add to the front
         :return: None
         """
-        new_node = Node(val)
+        if self._free:
+            new_node = self._free.pop()
+            new_node.value = val
+        else:
+            new_node = Node(val)
+        if self._index is not None:
+            self._index_add(new_node, back)
         if back == True:   # push to back of DLL
             if self.head is None:  # DLL is empty
                 self.head = new_node
@@ -145,6 +218,7 @@ class DLL:
                 new_node.next = self.head
                 self.head.prev = new_node
                 self.head = new_node
+        self.size += 1
 
 
     def pop(self, back: bool = True) -> None:
@@ -158,7 +232,10 @@ class DLL:
         if self.empty() == True:  # check for empty DLL
             return False
         else:
-            if self.head == self.tail:  # only one node left
+            removed = self.tail if back == True else self.head
+            if self._index is not None:
+                self._index_discard(removed)
+            if self.head is self.tail:  # only one node left
                 self.head = None
                 self.tail = None
             elif back == True:  # remove from back of DLL
@@ -169,6 +246,9 @@ class DLL:
                 if self.head.next is not None:
                     self.head.next.prev = None
                 self.head = self.head.next
+            self.size -= 1
+            if self._free is not None:
+                self._recycle(removed)
 
 
     def list_to_dll(self, source: List[T]) -> None:
@@ -177,22 +257,229 @@ class DLL:
         :param source: Standard Python list from which to construct DLL.
         :return None
         """
-        # clear DLL
-        self.head = None
-        self.tail = None
+        # build into an empty DLL so this one is left untouched if that fails
+        built = DLL(indexed=self._index is not None)
+        built.extend(source)
+        self.head = built.head
+        self.tail = built.tail
+        self.size = built.size
+        self._index = built._index
+
+    def _link_chain(self, values: Iterable[T], back: bool) -> None:
+        """
+        Links Nodes for values into a detached chain in one pass, then attaches
+        the chain to the back (or front) of the DLL. For the front, each value
+        goes in front of the previous one, as repeated push(val, False) would do.
+        If indexed, each value is hashed as its Node is built, so an unhashable
+        value raises before the DLL or its index is changed.
+        :param values: values to add
+        :param back: bool: If True, attach to the back of the DLL. If False, to the front
+        :return None
+        """
+        index = self._index
+        first = last = None
+        count = 0
+        if back == True:
+            for val in values:
+                if index is not None:
+                    hash(val)
+                node = Node(val, None, last)
+                if last is None:
+                    first = node
+                else:
+                    last.next = node
+                last = node
+                count += 1
+        else:
+            for val in values:
+                if index is not None:
+                    hash(val)
+                node = Node(val, first, None)
+                if first is None:
+                    last = node
+                else:
+                    first.prev = node
+                first = node
+                count += 1
+        if first is None:
+            return
+
+        if index is not None:
+            node = first if back == True else last
+            while node is not None:
+                self._index_add(node, back)
+                node = node.next if back == True else node.prev
+        if self.head is None:
+            self.head = first
+            self.tail = last
+        elif back == True:
+            self.tail.next = first
+            first.prev = self.tail
+            self.tail = last
+        else:
+            last.next = self.head
+            self.head.prev = last
+            self.head = first
+        self.size += count
+
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Adds Nodes containing each value to the back of the DLL in one pass
+        :param values: values to add, in order
+        :return None
+        """
+        self._link_chain(values, back=True)
+
+    def extendleft(self, values: Iterable[T]) -> None:
+        """
+        Adds Nodes containing each value to the front of the DLL in one pass.
+        Like deque.extendleft, the values end up in reverse order.
+        :param values: values to add
+        :return None
+        """
+        self._link_chain(values, back=False)
 
-        for item in source:
-            self.push(item)
+    def _reindex(self) -> None:
+        """
+        Rebuilds the value index from the Nodes in list order
+        :return None
+        """
+        self._index = {}
+        node = self.head
+        while node is not None:
+            self._index_add(node)
+            node = node.next
+
+    def _take(self, other: DLL) -> None:
+        """
+        Leaves other empty once its Nodes have been relinked into self
+        :param other: DLL whose Nodes were taken
+        :return None
+        """
+        other.head = other.tail = None
+        other.size = 0
+        if other._index is not None:
+            other._index = {}
+
+    def splice(self, other: DLL, at_node: Node = None) -> None:
+        """
+        Moves every Node of other into this DLL in front of at_node (or at the
+        back if at_node is None), leaving other empty. Nodes are relinked, not
+        copied, so this is O(1) unless self is indexed: then other's Nodes are
+        indexed in O(k) when they go at the front or back, and the whole index
+        is rebuilt in O(n) when they go in the middle. An unhashable value in
+        other raises TypeError before either DLL is changed.
+        :param other: DLL to move the Nodes from
+        :param at_node: Node of this DLL to insert in front of, or None for the back
+        :return None
+        """
+        if other is self:
+            raise ValueError("cannot splice a DLL into itself")
+        first, last = other.head, other.tail
+        if first is None:
+            return
+        if self._index is not None:
+            # hash every value before relinking, so an unhashable one raises
+            # with both DLLs intact
+            node = first
+            while node is not None:
+                hash(node.value)
+                node = node.next
+
+        if at_node is None:
+            pred, succ = self.tail, None
+        else:
+            pred, succ = at_node.prev, at_node
+        first.prev = pred
+        last.next = succ
+        if pred is None:
+            self.head = first
+        else:
+            pred.next = first
+        if succ is None:
+            self.tail = last
+        else:
+            succ.prev = last
+        self.size += other.size
+
+        if self._index is not None:
+            if succ is None:
+                node = first
+                while node is not None:
+                    self._index_add(node)
+                    node = node.next
+            elif pred is None:
+                node = last
+                while node is not None:
+                    self._index_add(node, back=False)
+                    node = node.prev
+            else:
+                self._reindex()
+        self._take(other)
+
+    def concat(self, other: DLL) -> None:
+        """
+        Moves every Node of other to the back of this DLL, leaving other empty.
+        O(1), plus O(k) to index other's Nodes if self is indexed.
+        :param other: DLL to move the Nodes from
+        :return None
+        """
+        self.splice(other)
+
+    def split_at(self, node: Node) -> DLL:
+        """
+        Detaches node and every Node after it into a new DLL, which is indexed
+        if this one is. node must belong to this DLL. Relinking is O(1) but the
+        size of each half is not known, so the smaller half is counted by
+        walking out from node in both directions at once: O(min(k, n - k)).
+        Moving index entries costs O(k) for the k detached Nodes.
+        :param node: first Node of the detached part
+        :return DLL holding node through the old tail
+        """
+        split = DLL(indexed=self._index is not None, free_list=self._free_limit)
+        back, forward = node.prev, node
+        count = 0
+        while back is not None and forward is not None:
+            back = back.prev
+            forward = forward.next
+            count += 1
+        # forward ran out first: count Nodes from node to the tail
+        # back ran out first: count Nodes before node
+        moved = count if forward is None else self.size - count
+
+        pred = node.prev
+        split.head, split.tail = node, self.tail
+        split.size = moved
+        node.prev = None
+        if pred is None:
+            self.head = self.tail = None
+        else:
+            pred.next = None
+            self.tail = pred
+        self.size -= moved
+
+        if self._index is not None:
+            curr = split.tail
+            while curr is not None:
+                # the detached Nodes are the last entries of each deque
+                nodes = self._index[curr.value]
+                nodes.pop()
+                if len(nodes) == 0:
+                    del self._index[curr.value]
+                split._index_add(curr, back=False)
+                curr = curr.prev
+        return split
 
     def dll_to_list(self) -> List[T]:
         """
         Creates a standard Python list from a DLL
         :return list[T] containing the values of the nodes in the DLL.
         """
-        py_list = []
+        # size is maintained, so fill a preallocated list
+        py_list = [None] * self.size
         curr = self.head
-        while curr is not None:
-            py_list.append(curr.value)
+        for i in range(self.size):
+            py_list[i] = curr.value
             curr = curr.next
 
         return py_list
@@ -207,6 +494,12 @@ class DLL:
         :return list of Node objects in the DLL whose value is val.
         If val does not exist in the DLL, returns empty list
         """
+        if self._index is not None:
+            nodes = self._index.get(val)
+            if nodes is None:
+                return []
+            return [nodes[0]] if find_first == True else list(nodes)
+
         nodes_w_val = []
         curr = self.head
         while curr is not None:
@@ -251,6 +544,8 @@ class DLL:
         """
         succ = to_remove.next
         pred = to_remove.prev
+        if self._index is not None:
+            self._index_discard(to_remove)
 
         if succ is not None:
             succ.prev = pred
@@ -260,6 +555,9 @@ class DLL:
             self.head = succ
         if to_remove is self.tail:
             self.tail = pred
+        self.size -= 1
+        if self._free is not None:
+            self._recycle(to_remove)
 
     def remove(self, val: T) -> bool:
         """
@@ -306,6 +604,10 @@ class DLL:
         self.tail = self.head
         self.head = tail_node
 
+        if self._index is not None:
+            for nodes in self._index.values():
+                nodes.reverse()
+
 
 def fix_playlist(lst: DLL) -> bool:
     """
@@ -357,10 +659,3 @@ def fix_playlist(lst: DLL) -> bool:
         return True
     elif dll_type == 3:  # improper cycle
         return False
-
-
-
-
-
-
-
@@ -0,0 +1,235 @@
+import pickle
+import random
+import threading
+
+import pytest
+
+from proj01 import ConcurrentSinglyLinkedList, SinglyLinkedList
+
+
+def check_invariants(data: SinglyLinkedList) -> list:
+    """
+    Walks an SLL and checks that head, tail, the running aggregates and, if
+    the list is indexed, the value index all agree with the nodes
+    :param data: SLL to check
+    :return: the values in the list, head to tail
+    """
+    values = []
+    nodes = []
+    current_node = data.head
+    while current_node is not None:
+        values.append(current_node.val)
+        nodes.append(current_node)
+        current_node = current_node.next
+    assert data.tail is (nodes[-1] if nodes else None)
+    assert len(data) == data.length() == len(values)
+    if values and all(type(value) == int for value in values):
+        assert data.sum_list() == sum(values)
+
+    if data._index is not None:
+        expected = {}
+        for node in nodes:
+            expected.setdefault(node.val, []).append(node)
+        assert set(data._index) == set(expected)
+        for value, value_nodes in expected.items():
+            assert len(data._index[value]) == len(value_nodes)
+            assert all(a is b for a, b in zip(data._index[value], value_nodes))
+        assert len(data._prev) == len(nodes)
+        for prev_node, node in zip([None] + nodes, nodes):
+            assert data._prev[id(node)] is prev_node
+    return values
+
+
+def test_indexed_matches_plain_under_random_operations():
+    """
+    Applies the same random operations to an indexed SLL and a Python list
+    and checks that results, contents and the index agree after every step
+    """
+    rng = random.Random(331)
+    for _ in range(200):
+        data = SinglyLinkedList(indexed=True)
+        model = []
+        for _ in range(40):
+            op = rng.randrange(10)
+            value = rng.randrange(5)
+            if op == 0:
+                data.push(value)
+                model.append(value)
+            elif op == 1:
+                data.prepend(value)
+                model.insert(0, value)
+            elif op == 2:
+                assert data.remove(value) == (value in model)
+                if value in model:
+                    model.remove(value)
+            elif op == 3:
+                data.remove_all(value)
+                model = [v for v in model if v != value]
+            elif op == 4:
+                assert data.remove_if(lambda v: v == value) == model.count(value)
+                model = [v for v in model if v != value]
+            elif op == 5:
+                drop = {value, rng.randrange(5)}
+                assert data.remove_many(drop) == sum(v in drop for v in model)
+                model = [v for v in model if v not in drop]
+            elif op == 6:
+                i = rng.randint(0, len(model))
+                j = rng.randint(i, len(model))
+                data.reverse_range(i, j)
+                model[i:j] = model[i:j][::-1]
+            elif op == 7:
+                extra = [rng.randrange(5) for _ in range(rng.randrange(4))]
+                data.extend(iter(extra))
+                model.extend(extra)
+            elif op == 8:
+                extra = [rng.randrange(5) for _ in range(rng.randrange(4))]
+                data.splice(SinglyLinkedList.from_iterable(extra, indexed=rng.random() < 0.5))
+                model.extend(extra)
+            else:
+                assert data.search(value) == (value in model)
+                assert data.count(value) == model.count(value)
+            assert check_invariants(data) == model
+
+
+def test_indexed_push_of_unhashable_value_leaves_list_intact():
+    """
+    An unhashable value raises before the node is linked in
+    """
+    data = SinglyLinkedList.from_iterable([1, 2], indexed=True)
+    with pytest.raises(TypeError):
+        data.push([3])
+    assert check_invariants(data) == [1, 2]
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_extend_with_itself_doubles_the_list(indexed):
+    """
+    extend reads `values` completely before attaching anything, so a list
+    can be extended with itself
+    """
+    data = SinglyLinkedList.from_iterable([1, 2, 1], indexed=indexed)
+    data.extend(data)
+    assert check_invariants(data) == [1, 2, 1, 1, 2, 1]
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_failed_extend_leaves_list_intact(indexed):
+    """
+    A raising iterator, or an unhashable value on an indexed list, leaves
+    the list as it was
+    """
+    def failing():
+        yield 2
+        raise ValueError
+
+    data = SinglyLinkedList.from_iterable([1], indexed=indexed)
+    with pytest.raises(ValueError):
+        data.extend(failing())
+    assert check_invariants(data) == [1]
+    if indexed:
+        with pytest.raises(TypeError):
+            data.extend([2, [3], 4])
+        assert check_invariants(data) == [1]
+        assert not data.search(2)
+
+
+def test_indexed_splice_of_unhashable_value_leaves_both_lists_intact():
+    """
+    Splicing a list holding an unhashable value into an indexed list raises
+    with neither list changed
+    """
+    data = SinglyLinkedList.from_iterable([1], indexed=True)
+    other = SinglyLinkedList.from_iterable([2, [3], 4])
+    with pytest.raises(TypeError):
+        data.splice(other)
+    assert check_invariants(data) == [1]
+    assert check_invariants(other) == [2, [3], 4]
+    assert not data.search(2)
+
+
+def test_remove_many_skips_unhashable_list_values():
+    """
+    A list holding unhashable values is purged like remove_all would, not
+    left half-purged by a TypeError
+    """
+    data = SinglyLinkedList.from_iterable([1, [2], 1, 3])
+    assert data.remove_many([1, 3]) == 3
+    assert check_invariants(data) == [[2]]
+
+
+def test_indexed_list_survives_pickling():
+    """
+    Unpickling rebuilds the index along with the values
+    """
+    data = SinglyLinkedList.from_iterable([3, 1, 3, 2], indexed=True)
+    copy = pickle.loads(pickle.dumps(data))
+    assert check_invariants(copy) == [3, 1, 3, 2]
+    assert copy.count(3) == 2
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_concurrent_writers_and_readers(indexed):
+    """
+    Writer w pushes the values w, w + writers, w + 2 * writers, ... and then
+    removes every even one, while readers search and count without the lock.
+    Afterwards only the odd values are left and every invariant holds
+    """
+    writers, readers, pushes = 4, 2, 500
+    data = ConcurrentSinglyLinkedList(indexed=indexed)
+    done = threading.Event()
+    reads = [0] * readers
+
+    def write(w: int) -> None:
+        values = range(w, pushes * writers, writers)
+        for value in values:
+            data.push(value)
+        for value in values:
+            if value % 2 == 0:
+                data.remove(value)
+
+    def read(r: int) -> None:
+        while not done.is_set():
+            value = reads[r] % (pushes * writers)
+            data.search(value)
+            data.count(value)
+            reads[r] += 1
+
+    reader_threads = [threading.Thread(target=read, args=(r,)) for r in range(readers)]
+    writer_threads = [threading.Thread(target=write, args=(w,)) for w in range(writers)]
+    for thread in reader_threads + writer_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    done.set()
+    for thread in reader_threads:
+        thread.join()
+
+    values = check_invariants(data)
+    assert sorted(values) == [value for value in range(pushes * writers) if value % 2 == 1]
+    assert sum(reads) > 0
+
+
+def test_concurrent_opposite_splices():
+    """
+    Two threads splicing two lists into each other in opposite directions
+    must not deadlock, and no node may be lost
+    """
+    first = ConcurrentSinglyLinkedList()
+    second = ConcurrentSinglyLinkedList()
+    first.extend(range(100))
+    second.extend(range(100, 200))
+
+    def splice_back_and_forth(target, source) -> None:
+        for _ in range(500):
+            target.splice(source)
+
+    threads = [threading.Thread(target=splice_back_and_forth, args=(first, second)),
+               threading.Thread(target=splice_back_and_forth, args=(second, first))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert not any(thread.is_alive() for thread in threads)
+
+    values = check_invariants(first) + check_invariants(second)
+    assert sorted(values) == list(range(200))
@@ -0,0 +1,231 @@
+import random
+import sys
+
+import pytest
+
+from proj02 import PersistentSinglyLinkedList, RecursiveSinglyLinkedList, reverse
+
+MODES = RecursiveSinglyLinkedList.MODES
+
+
+def check_invariants(data: RecursiveSinglyLinkedList) -> list:
+    """
+    Walks an SLL and checks that tail is its last node
+    :param data: SLL to check
+    :return: the values in the list, head to tail
+    """
+    values = []
+    last = None
+    curr = data.head
+    while curr is not None:
+        values.append(curr.val)
+        last = curr
+        curr = curr.next
+    assert data.tail is last
+    return values
+
+
+def build(values: list, mode: str = "recursive", persistent: bool = False) -> RecursiveSinglyLinkedList:
+    """
+    Builds an SLL holding values
+    :param values: values in order
+    :param mode: execution mode
+    :param persistent: True for a PersistentSinglyLinkedList
+    :return: the list
+    """
+    if persistent:
+        return PersistentSinglyLinkedList(mode).push_many(values)
+    data = RecursiveSinglyLinkedList(mode)
+    data.push_many(values)
+    return data
+
+
+def model_string(model: list) -> str:
+    """
+    Renders a Python list the way to_string renders an SLL
+    :param model: values in order
+    :return: expected to_string result
+    """
+    return " --> ".join(map(str, model)) if model else "None"
+
+
+def test_modes_agree_and_caches_follow_mutations():
+    """
+    Applies the same random operations to one list per mode and a Python
+    list. Aggregates are queried between mutations, so a stale cache after
+    push, push_many, remove, remove_all or reverse would show up as a
+    mismatch; every mode must return the same results as the model
+    """
+    rng = random.Random(331)
+    for _ in range(100):
+        lists = [RecursiveSinglyLinkedList(mode) for mode in MODES]
+        model = []
+        for _ in range(40):
+            op = rng.randrange(8)
+            value = rng.randrange(5)
+            if op == 0:
+                back = rng.random() < 0.5
+                for data in lists:
+                    data.push(value, back)
+                model = model + [value] if back else [value] + model
+            elif op == 1:
+                extra = [rng.randrange(5) for _ in range(rng.randrange(4))]
+                back = rng.random() < 0.5
+                for data in lists:
+                    data.push_many(iter(extra), back)
+                model = model + extra if back else extra[::-1] + model
+            elif op == 2:
+                assert {data.remove(value) for data in lists} == {value in model}
+                if value in model:
+                    model.remove(value)
+            elif op == 3:
+                assert {data.remove_all(value) for data in lists} == {model.count(value)}
+                model = [v for v in model if v != value]
+            elif op == 4:
+                drop = {value, rng.randrange(5)}
+                expected = sum(v in drop for v in model)
+                assert {data.remove_all(values=drop) for data in lists} == {expected}
+                model = [v for v in model if v not in drop]
+            elif op == 5:
+                for data in lists:
+                    reverse(data, data.head)
+                model.reverse()
+            for data in lists:
+                assert check_invariants(data) == model
+                assert data.length(data.head) == len(model)
+                assert data.sum_list(data.head) == (sum(model) if model else None)
+                assert data.count(value) == model.count(value)
+                assert data.search(value) == (value in model)
+                assert data.to_string(data.head) == model_string(model)
+
+
+def test_persistent_snapshots_are_unchanged_by_later_versions():
+    """
+    Every version produced along a random history still holds the values it
+    had when it was created
+    """
+    rng = random.Random(331)
+    for mode in MODES:
+        for _ in range(50):
+            versions = [(PersistentSinglyLinkedList(mode), [])]
+            for _ in range(30):
+                data, model = rng.choice(versions)
+                op = rng.randrange(5)
+                value = rng.randrange(5)
+                if op == 0:
+                    back = rng.random() < 0.5
+                    data = data.push(value, back)
+                    model = model + [value] if back else [value] + model
+                elif op == 1:
+                    extra = [rng.randrange(5) for _ in range(rng.randrange(4))]
+                    back = rng.random() < 0.5
+                    data = data.push_many(extra, back)
+                    model = model + extra if back else extra[::-1] + model
+                elif op == 2:
+                    data = data.remove(value)
+                    model = list(model)
+                    if value in model:
+                        model.remove(value)
+                elif op == 3:
+                    data = data.remove_all(value)
+                    model = [v for v in model if v != value]
+                else:
+                    assert data.count(value) == model.count(value)
+                versions.append((data, model))
+            for data, model in versions:
+                assert check_invariants(data) == model
+                assert data.length(data.head) == len(model)
+
+
+def test_persistent_list_cannot_be_reversed_in_place():
+    """
+    Reversing would relink nodes other versions share
+    """
+    data = PersistentSinglyLinkedList().push_many([1, 2, 3])
+    with pytest.raises(TypeError):
+        reverse(data, data.head)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_profile_stats_record_calls_visits_and_depth(mode):
+    """
+    Each profiled operation records its calls and the nodes it actually
+    visited; depth is the recursion depth, which only recursive mode uses
+    """
+    data = build(list(range(10)), mode)
+    assert data.profile_stats() == {}
+    data.enable_profiling()
+    recursive = mode == "recursive"
+
+    assert data.search(3)
+    assert not data.search(-1)
+    assert data.remove(4)
+    assert data.remove_all(-1) == 0
+    reverse(data, data.head)
+
+    stats = data.profile_stats()
+    assert set(stats) == {"search", "remove", "remove_all", "reverse"}
+    assert stats["search"]["calls"] == 2
+    assert stats["search"]["nodes_visited"] == 4 + 10
+    assert stats["search"]["max_depth"] == (10 if recursive else 0)
+    assert stats["remove"]["nodes_visited"] == 5
+    assert stats["remove_all"]["nodes_visited"] == 9
+    assert stats["reverse"]["nodes_visited"] == 9
+    assert stats["reverse"]["max_depth"] == (9 if recursive else 0)
+    for record in stats.values():
+        assert record["errors"] == 0
+        assert record["seconds"] >= 0
+
+    # exported stats are copies
+    stats["search"]["calls"] = 100
+    assert data.profile_stats()["search"]["calls"] == 2
+    data.disable_profiling()
+    data.search(3)
+    assert data.profile_stats() == {}
+
+
+def test_profile_stats_record_depth_reached_on_recursion_error():
+    """
+    A traversal that runs out of stack is counted as an error, with the
+    depth it actually reached
+    """
+    data = build(list(range(sys.getrecursionlimit() * 2)))
+    data.enable_profiling()
+    with pytest.raises(RecursionError):
+        data.search(-1)
+    stats = data.profile_stats()["search"]
+    assert stats["errors"] == 1
+    assert 0 < stats["max_depth"] < sys.getrecursionlimit()
+    assert stats["nodes_visited"] == stats["max_depth"]
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("persistent", [False, True])
+def test_remove_all_values_skips_unhashable_list_values(mode, persistent):
+    """
+    remove_all(values=...) on a list holding unhashable values removes the
+    matches instead of raising halfway through
+    """
+    data = build([1, [2], 1, 3], mode, persistent)
+    if persistent:
+        version = data.remove_all(values=[1, 3])
+        assert check_invariants(version) == [[2]]
+        assert check_invariants(data) == [1, [2], 1, 3]
+    else:
+        assert data.remove_all(values=[1, 3]) == 3
+        assert check_invariants(data) == [[2]]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_profiled_count_records_cache_hits_as_calls(mode):
+    """
+    Every count() call is recorded; only the first one traverses the list
+    """
+    data = build([3, 1, 3, 2], mode)
+    data.enable_profiling()
+    for _ in range(3):
+        assert data.count(3) == 2
+    stats = data.profile_stats()["count"]
+    assert stats["calls"] == 3
+    assert stats["nodes_visited"] == 4
+    assert stats["max_depth"] == (4 if mode == "recursive" else 0)
@@ -0,0 +1,186 @@
+import random
+
+import pytest
+
+from proj03 import DLL
+
+
+def check_invariants(dll: DLL) -> list:
+    """
+    Walks a DLL and checks that prev/next links, head, tail, size and, if
+    the DLL is indexed, the value index all agree with the Nodes
+    :param dll: DLL to check
+    :return: the values in the DLL, head to tail
+    """
+    nodes = []
+    prev = None
+    node = dll.head
+    while node is not None:
+        assert node.prev is prev
+        nodes.append(node)
+        prev = node
+        node = node.next
+    assert dll.tail is prev
+    assert len(dll) == dll.size == len(nodes)
+
+    if dll._index is not None:
+        expected = {}
+        for node in nodes:
+            expected.setdefault(node.value, []).append(node)
+        assert set(dll._index) == set(expected)
+        for value, value_nodes in expected.items():
+            assert len(dll._index[value]) == len(value_nodes)
+            assert all(a is b for a, b in zip(dll._index[value], value_nodes))
+    return [node.value for node in nodes]
+
+
+@pytest.mark.parametrize("free_list", [0, 2])
+def test_indexed_matches_plain_under_random_operations(free_list):
+    """
+    Applies the same random operations to an indexed DLL and a Python list
+    and checks that results, contents and the index agree after every step
+    """
+    rng = random.Random(331)
+    for _ in range(200):
+        dll = DLL(indexed=True, free_list=free_list)
+        model = []
+        for _ in range(40):
+            op = rng.randrange(12)
+            value = rng.randrange(5)
+            if op == 0:
+                dll.push(value)
+                model.append(value)
+            elif op == 1:
+                dll.push(value, back=False)
+                model.insert(0, value)
+            elif op == 2:
+                back = rng.random() < 0.5
+                dll.pop(back)
+                model = model[:-1] if back else model[1:]
+            elif op == 3:
+                assert dll.remove(value) == (value in model)
+                if value in model:
+                    model.remove(value)
+            elif op == 4:
+                assert dll.remove_all(value) == model.count(value)
+                model = [v for v in model if v != value]
+            elif op == 5:
+                dll.reverse()
+                model.reverse()
+            elif op == 6:
+                extra = [rng.randrange(5) for _ in range(rng.randrange(4))]
+                dll.extend(iter(extra))
+                model.extend(extra)
+            elif op == 7:
+                extra = [rng.randrange(5) for _ in range(rng.randrange(4))]
+                dll.extendleft(iter(extra))
+                model = extra[::-1] + model
+            elif op == 8:
+                model = [rng.randrange(5) for _ in range(rng.randrange(8))]
+                dll.list_to_dll(model)
+            elif op == 9:
+                extra = [rng.randrange(5) for _ in range(rng.randrange(4))]
+                other = DLL(indexed=rng.random() < 0.5)
+                other.list_to_dll(extra)
+                position = rng.randint(0, len(model))
+                at_node = dll.head
+                for _ in range(position):
+                    at_node = at_node.next
+                dll.splice(other, at_node)
+                model[position:position] = extra
+                assert check_invariants(other) == []
+            elif op == 10 and model:
+                position = rng.randrange(len(model))
+                node = dll.head
+                for _ in range(position):
+                    node = node.next
+                split = dll.split_at(node)
+                model, detached = model[:position], model[position:]
+                assert check_invariants(split) == detached
+                assert check_invariants(dll) == model
+                if rng.random() < 0.5:
+                    dll.concat(split)
+                    model.extend(detached)
+            else:
+                found = dll.find(value)
+                assert (found is None) == (value not in model)
+                assert len(dll.find_all(value)) == model.count(value)
+            assert check_invariants(dll) == model
+            assert dll.dll_to_list() == model
+
+
+def test_split_at_then_concat_round_trips():
+    """
+    split_at hands the tail part to a new indexed DLL and concat puts it back
+    """
+    dll = DLL(indexed=True)
+    dll.list_to_dll([1, 2, 3, 2, 1])
+    split = dll.split_at(dll.head.next.next)
+    assert check_invariants(dll) == [1, 2]
+    assert check_invariants(split) == [3, 2, 1]
+    assert split.find(3) is split.head
+    dll.concat(split)
+    assert check_invariants(dll) == [1, 2, 3, 2, 1]
+    assert check_invariants(split) == []
+
+
+@pytest.mark.parametrize("method", ["extend", "extendleft", "list_to_dll"])
+def test_indexed_bulk_add_of_unhashable_value_leaves_dll_intact(method):
+    """
+    An unhashable value raises before any Node is indexed or linked in
+    """
+    dll = DLL(indexed=True)
+    dll.push(1)
+    with pytest.raises(TypeError):
+        getattr(dll, method)([2, [3], 4])
+    assert check_invariants(dll) == [1]
+    assert dll.find(2) is None
+
+
+@pytest.mark.parametrize("position", [None, 0, 1])
+def test_indexed_splice_of_unhashable_value_leaves_both_dlls_intact(position):
+    """
+    Splicing a DLL holding an unhashable value into an indexed DLL raises
+    with neither DLL changed, wherever the Nodes would have gone
+    """
+    dll = DLL(indexed=True)
+    dll.list_to_dll([1, 5])
+    other = DLL()
+    other.list_to_dll([2, [3], 4])
+    at_node = None if position is None else [dll.head, dll.tail][position]
+    with pytest.raises(TypeError):
+        dll.splice(other, at_node)
+    assert check_invariants(dll) == [1, 5]
+    assert check_invariants(other) == [2, [3], 4]
+    assert dll.find(2) is None
+
+
+def test_indexed_push_of_unhashable_value_leaves_dll_intact():
+    """
+    push indexes the Node before linking it, so nothing changes on failure
+    """
+    dll = DLL(indexed=True)
+    dll.push(1)
+    with pytest.raises(TypeError):
+        dll.push([2])
+    assert check_invariants(dll) == [1]
+
+
+def test_free_list_reuses_cleared_nodes_up_to_its_bound():
+    """
+    Removed Nodes are cleared and kept up to the bound, and push reuses them
+    """
+    dll = DLL(free_list=2)
+    dll.list_to_dll([1, 2, 3, 4])
+    last = dll.tail
+    dll.pop()
+    dll.pop()
+    dll.pop()
+    assert len(dll._free) == 2
+    assert last in dll._free
+    assert last.value is None and last.next is None and last.prev is None
+    dll.push(5)
+    dll.push(6)
+    assert last in (dll.head.next, dll.tail)
+    assert check_invariants(dll) == [1, 5, 6]
+    assert len(dll._free) == 0